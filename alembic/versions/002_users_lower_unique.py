@@ -0,0 +1,37 @@
+"""Case-insensitive unique usernames and emails
+
+Revision ID: 002_users_lower_unique
+Revises: 001_initial_schema
+Create Date: 2024-01-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '002_users_lower_unique'
+down_revision: Union[str, None] = '001_initial_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Expression indexes back register's case-insensitive existence check.
+    # Built CONCURRENTLY (outside the migration transaction) so writes to
+    # users are not blocked while they build.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_users_username_lower '
+            'ON users (lower(username))'
+        )
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_users_email_lower '
+            'ON users (lower(email))'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ux_users_email_lower')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ux_users_username_lower')
@@ -0,0 +1,45 @@
+"""Composite indexes for role permission checks and per-user audit history
+
+Revision ID: 003_permission_and_audit_indexes
+Revises: 002_users_lower_unique
+Create Date: 2024-01-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '003_permission_and_audit_indexes'
+down_revision: Union[str, None] = '002_users_lower_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built CONCURRENTLY (outside the migration transaction) so permission
+    # checks and audit writes are not blocked while the indexes build.
+    with op.get_context().autocommit_block():
+        # Role-based document permission lookups
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_permissions_document_role '
+            'ON document_permissions (document_id, role)'
+        )
+        
+        # A user's most recent audit entries; its user_id prefix also serves
+        # plain user_id lookups, so the single-column index is dropped
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_user_timestamp '
+            'ON audit_logs (user_id, "timestamp" DESC)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_user_id')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_user_id '
+            'ON audit_logs (user_id)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_user_timestamp')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_document_permissions_document_role')
@@ -0,0 +1,56 @@
+"""Store document metadata and audit log JSON columns as JSONB
+
+Revision ID: 004_jsonb_columns
+Revises: 003_permission_and_audit_indexes
+Create Date: 2024-01-04 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004_jsonb_columns'
+down_revision: Union[str, None] = '003_permission_and_audit_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs converted between JSON and JSONB
+JSON_COLUMNS = (
+    ('documents', 'metadata'),
+    ('audit_logs', 'retrieved_documents'),
+    ('audit_logs', 'sources'),
+)
+
+
+def upgrade() -> None:
+    # JSONB is stored parsed, so reads skip re-parsing and GIN indexes apply.
+    # Each ALTER rewrites its table under an exclusive lock.
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB,
+            postgresql_using=f'"{column}"::jsonb'
+        )
+    
+    op.create_index(
+        'ix_audit_logs_sources',
+        'audit_logs',
+        ['sources'],
+        postgresql_using='gin',
+        postgresql_ops={'sources': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_logs_sources', table_name='audit_logs')
+    
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSON,
+            postgresql_using=f'"{column}"::json'
+        )
@@ -0,0 +1,45 @@
+"""Store role permissions as JSONB with a GIN index
+
+Revision ID: 005_roles_permissions_jsonb
+Revises: 004_jsonb_columns
+Create Date: 2024-01-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005_roles_permissions_jsonb'
+down_revision: Union[str, None] = '004_jsonb_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'roles',
+        'permissions',
+        type_=postgresql.JSONB,
+        postgresql_using='permissions::jsonb'
+    )
+    
+    # jsonb_path_ops only supports @>, but is much smaller than jsonb_ops
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_roles_permissions '
+            'ON roles USING gin (permissions jsonb_path_ops)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_roles_permissions')
+    
+    op.alter_column(
+        'roles',
+        'permissions',
+        type_=postgresql.JSON,
+        postgresql_using='permissions::json'
+    )
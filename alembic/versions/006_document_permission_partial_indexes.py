@@ -0,0 +1,49 @@
+"""Partial composite indexes for document permission checks
+
+Revision ID: 006_document_permission_partial_indexes
+Revises: 005_roles_permissions_jsonb
+Create Date: 2024-01-06 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '006_document_permission_partial_indexes'
+down_revision: Union[str, None] = '005_roles_permissions_jsonb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The new indexes cover (document, grantee, permission_type) and
+    # replace the (document, grantee) ones. ix_document_permissions_user_id
+    # stays for cascading deletes from users.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_permissions_document_user_type '
+            'ON document_permissions (document_id, user_id, permission_type) '
+            'WHERE user_id IS NOT NULL'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_permissions_document_role_type '
+            'ON document_permissions (document_id, role, permission_type) '
+            'WHERE role IS NOT NULL'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_document_permissions_document_user')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_document_permissions_document_role')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_permissions_document_user '
+            'ON document_permissions (document_id, user_id)'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_permissions_document_role '
+            'ON document_permissions (document_id, role)'
+        )
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_document_permissions_document_role_type')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_document_permissions_document_user_type')
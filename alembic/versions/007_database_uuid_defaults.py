@@ -0,0 +1,65 @@
+"""Generate primary-key UUIDs in the database
+
+Revision ID: 007_database_uuid_defaults
+Revises: 006_document_permission_partial_indexes
+Create Date: 2024-01-07 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '007_database_uuid_defaults'
+down_revision: Union[str, None] = '006_document_permission_partial_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Time-ordered UUIDv7 generator (48-bit Unix ms timestamp + random bits), used
+# for append-heavy tables so new keys land on the rightmost B-tree leaf.
+UUIDV7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid AS $$
+    SELECT encode(
+        set_bit(
+            set_bit(
+                overlay(
+                    uuid_send(gen_random_uuid())
+                    placing substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                    FROM 1 FOR 6
+                ),
+                52, 1
+            ),
+            53, 1
+        ),
+        'hex'
+    )::uuid;
+$$ LANGUAGE sql VOLATILE;
+"""
+
+# Server-side id default per table; the models no longer generate ids
+ID_DEFAULTS = {
+    'users': 'gen_random_uuid()',
+    'documents': 'gen_random_uuid()',
+    'roles': 'gen_random_uuid()',
+    'document_permissions': 'gen_random_uuid()',
+    'document_chunks': 'uuidv7()',
+    'audit_logs': 'uuidv7()',
+}
+
+
+def upgrade() -> None:
+    # gen_random_uuid() needs pgcrypto on PostgreSQL < 13; uuidv7() is used
+    # for append-heavy tables. Only defaults change, existing keys stay.
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    op.execute(UUIDV7_FUNCTION)
+    
+    for table, default in ID_DEFAULTS.items():
+        op.alter_column(table, 'id', server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for table in ID_DEFAULTS:
+        op.alter_column(table, 'id', server_default=None)
+    
+    op.execute('DROP FUNCTION IF EXISTS uuidv7()')
@@ -0,0 +1,54 @@
+"""Store chunk embeddings as pgvector vectors with an HNSW index
+
+Revision ID: 009_document_chunks_vector_embedding
+Revises: 008_audit_logs_timestamp_brin
+Create Date: 2024-01-09 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from pgvector.sqlalchemy import Vector
+
+# revision identifiers, used by Alembic.
+revision: str = '009_document_chunks_vector_embedding'
+down_revision: Union[str, None] = '008_audit_logs_timestamp_brin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Embedding vector size for document_chunks.embedding (intfloat/e5-base)
+EMBEDDING_DIMENSION = 768
+
+
+def upgrade() -> None:
+    # pgvector stores chunk embeddings natively for in-database similarity
+    # search. Text embeddings in "[x, y, ...]" form parse as vectors; the
+    # ALTER rewrites the table under an exclusive lock.
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.alter_column(
+        'document_chunks',
+        'embedding',
+        type_=Vector(EMBEDDING_DIMENSION),
+        postgresql_using=f'embedding::vector({EMBEDDING_DIMENSION})'
+    )
+    
+    # HNSW needs pgvector >= 0.5; built CONCURRENTLY so chunk writes are
+    # not blocked while it builds
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_chunks_embedding '
+            'ON document_chunks USING hnsw (embedding vector_cosine_ops)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_document_chunks_embedding')
+    
+    op.alter_column(
+        'document_chunks',
+        'embedding',
+        type_=sa.Text(),
+        postgresql_using='embedding::text'
+    )
@@ -0,0 +1,40 @@
+"""Drop indexes duplicating primary keys
+
+Revision ID: 010_drop_primary_key_id_indexes
+Revises: 009_document_chunks_vector_embedding
+Create Date: 2024-01-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010_drop_primary_key_id_indexes'
+down_revision: Union[str, None] = '009_document_chunks_vector_embedding'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose ix_<table>_id index duplicates the primary key index
+TABLES = (
+    'users',
+    'documents',
+    'document_chunks',
+    'audit_logs',
+    'roles',
+    'document_permissions',
+)
+
+
+def upgrade() -> None:
+    # Each primary key already has its own unique index; the extra ones only
+    # cost writes and space
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_id')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_id ON {table} (id)')
@@ -0,0 +1,40 @@
+"""Drop document_id indexes covered by composite indexes
+
+Revision ID: 011_drop_covered_document_id_indexes
+Revises: 010_drop_primary_key_id_indexes
+Create Date: 2024-01-11 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011_drop_covered_document_id_indexes'
+down_revision: Union[str, None] = '010_drop_primary_key_id_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table) pairs whose single-column document_id index is covered
+INDEXES = (
+    ('ix_document_chunks_document_id', 'document_chunks'),
+    ('ix_document_permissions_document_id', 'document_permissions'),
+)
+
+
+def upgrade() -> None:
+    # uq_document_chunks_document_chunk leads with document_id, and the
+    # partial (document_id, grantee, permission_type) indexes from 006 serve
+    # document permission checks, matching the models
+    with op.get_context().autocommit_block():
+        for index, _ in INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {index}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index, table in INDEXES:
+            op.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} '
+                f'ON {table} (document_id)'
+            )
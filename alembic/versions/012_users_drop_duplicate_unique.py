@@ -0,0 +1,34 @@
+"""Drop users UNIQUE constraints duplicating the unique indexes
+
+Revision ID: 012_users_drop_duplicate_unique
+Revises: 011_drop_covered_document_id_indexes
+Create Date: 2024-01-12 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012_users_drop_duplicate_unique'
+down_revision: Union[str, None] = '011_drop_covered_document_id_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Column-level UNIQUE constraints from 001 (PostgreSQL's default names)
+CONSTRAINTS = (
+    ('users_username_key', 'username'),
+    ('users_email_key', 'email'),
+)
+
+
+def upgrade() -> None:
+    # ix_users_username and ix_users_email are unique indexes on the same
+    # columns, so each constraint only maintained a second identical B-tree
+    for constraint, _ in CONSTRAINTS:
+        op.execute(f'ALTER TABLE users DROP CONSTRAINT IF EXISTS {constraint}')
+
+
+def downgrade() -> None:
+    for constraint, column in CONSTRAINTS:
+        op.create_unique_constraint(constraint, 'users', [column])
@@ -0,0 +1,32 @@
+"""Generate time-ordered UUIDv7 keys for users, roles, documents and permissions
+
+Revision ID: 013_uuidv7_primary_keys
+Revises: 012_users_drop_duplicate_unique
+Create Date: 2024-01-13 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '013_uuidv7_primary_keys'
+down_revision: Union[str, None] = '012_users_drop_duplicate_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose id default moves from gen_random_uuid() to uuidv7()
+TABLES = ('users', 'roles', 'documents', 'document_permissions')
+
+
+def upgrade() -> None:
+    # Only the default changes (uuidv7() is created in 007): existing keys
+    # stay as they are, new keys append to the right of the primary key index
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('uuidv7()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
@@ -9,26 +9,36 @@ from backend.auth.jwt import (
     create_access_token,
     create_refresh_token,
     verify_token,
+    verify_token_safe,
+    averify_token,
     decode_token,
     get_user_id_from_token,
 )
 from backend.auth.dependencies import (
     get_current_user,
     get_current_active_user,
+    get_current_principal,
     get_optional_current_user,
     security,
+    optional_security,
 )
+from backend.auth.principal import Principal
 
 __all__ = [
     # JWT functions
     "create_access_token",
     "create_refresh_token",
     "verify_token",
+    "verify_token_safe",
+    "averify_token",
     "decode_token",
     "get_user_id_from_token",
     # Dependencies
     "get_current_user",
     "get_current_active_user",
+    "get_current_principal",
     "get_optional_current_user",
     "security",
+    "optional_security",
+    "Principal",
 ]
@@ -0,0 +1,114 @@
+"""
+EVIDENT Authentication Cache
+
+This module caches the identity verified from a bearer token (user ID,
+token ID and issue time) in Redis, keyed by a digest of the token, so any worker can
+authenticate a recently seen token without verifying its signature. The
+user row itself still comes from the user cache or the database.
+When REDIS_URL is not configured the cache is disabled.
+"""
+
+import hashlib
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+from redis.exceptions import RedisError
+
+from backend.core.config import settings
+from backend.core.redis_client import get_redis
+from backend.utils.logger import StructuredLogger
+
+logger = StructuredLogger.get_logger()
+
+
+class AuthCache:
+    """
+    Redis cache of token -> verified identity.
+    
+    Entries live until the token expires or for at most max_ttl seconds,
+    whichever is sooner. Callers must still check the identity against
+    revocations on a hit. Redis errors are treated as cache misses so an outage
+    degrades to normal verification instead of failing requests.
+    """
+    
+    KEY_PREFIX = "auth:"
+    
+    def __init__(self, enabled: bool, max_ttl: int = 60):
+        """
+        Initialize authentication cache.
+        
+        Args:
+            enabled: Whether Redis is available
+            max_ttl: Maximum seconds an entry is kept
+        """
+        self.enabled = enabled
+        self.max_ttl = max_ttl
+    
+    def _key(self, token: str) -> str:
+        """Return the Redis key for a token (the raw token is never stored)."""
+        return f"{self.KEY_PREFIX}{hashlib.blake2b(token.encode(), digest_size=16).hexdigest()}"
+    
+    async def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached identity for a token.
+        
+        Args:
+            token: Bearer token
+        
+        Returns:
+            Identity dict ("id", "jti", "iat"), or None on a miss or when disabled
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            raw = await get_redis().get(self._key(token))
+        except RedisError as e:
+            logger.warning("Auth cache read failed: %s", e)
+            return None
+        
+        return orjson.loads(raw) if raw is not None else None
+    
+    async def set(self, token: str, fields: Dict[str, Any], expires_at: float) -> None:
+        """
+        Cache the verified identity for a token.
+        
+        Args:
+            token: Bearer token
+            fields: JSON-serializable identity ("id", "jti", "iat")
+            expires_at: Token expiry as a Unix timestamp ('exp' claim)
+        """
+        if not self.enabled:
+            return
+        
+        ttl = min(int(expires_at - time.time()), self.max_ttl)
+        if ttl <= 0:
+            return
+        
+        try:
+            await get_redis().set(self._key(token), orjson.dumps(fields), ex=ttl)
+        except RedisError as e:
+            logger.warning("Auth cache write failed: %s", e)
+    
+    async def delete(self, token: str) -> None:
+        """
+        Drop the cached entry for a token (e.g. on logout).
+        
+        Args:
+            token: Bearer token
+        """
+        if not self.enabled:
+            return
+        
+        try:
+            await get_redis().delete(self._key(token))
+        except RedisError as e:
+            logger.warning("Auth cache delete failed: %s", e)
+
+
+# Global authentication cache instance
+auth_cache = AuthCache(
+    enabled=bool(settings.redis_url),
+    max_ttl=settings.auth_cache_ttl_seconds
+)
@@ -6,43 +6,99 @@ including getting the current user from JWT tokens.
 """
 
 from typing import Optional
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from backend.core.database import get_db
-from backend.auth.jwt import verify_token, get_user_id_from_token
+from backend.core.database import get_async_db
+from backend.auth.auth_cache import auth_cache
+from backend.auth.jwt import averify_token, get_user_id_from_token
+from backend.auth.principal import Principal
+from backend.auth.token_blacklist import token_blacklist
+from backend.auth.user_cache import user_cache
 from backend.models.user import User
 from backend.utils.exceptions import AuthenticationError
 
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
+# Shared scheme for endpoints where authentication is optional
+optional_security = HTTPBearer(auto_error=False)
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+
+async def _verify_access_token(credentials: HTTPAuthorizationCredentials) -> dict:
+    """
+    Verify a bearer access token and reject revoked tokens.
+    
+    A token is revoked by logout, or by a per-user revocation (e.g. a role
+    change) recorded after it was issued, so stale role claims stop being
+    honored before the token expires.
+    
+    Args:
+        credentials: HTTP Bearer token credentials
+        
+    Returns:
+        Verified token payload
+        
+    Raises:
+        AuthenticationError: If the token is invalid, expired, or revoked
+    """
+    payload = await averify_token(credentials.credentials, token_type="access")
+    
+    if await token_blacklist.is_revoked(
+        payload.get("jti"), payload.get("sub"), payload.get("iat")
+    ):
+        raise AuthenticationError(message="Token has been revoked")
+    
+    return payload
+
+
+async def _resolve_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials,
+    db: AsyncSession
 ) -> User:
     """
-    FastAPI dependency to get the current authenticated user from JWT token.
+    Resolve the user identified by a bearer token.
+    
+    Shared by the required and optional current-user dependencies so both
+    go through the same verification and lookup path. The result is kept
+    on request.state.current_user, so later resolutions in the same request
+    (and code that only has the request) reuse it.
     
     Args:
+        request: Current request
         credentials: HTTP Bearer token credentials
         db: Database session
         
     Returns:
-        User: Current authenticated user
+        User: User identified by the token
         
     Raises:
         HTTPException: If authentication fails (401)
     """
+    user = getattr(request.state, "current_user", None)
+    if user is not None:
+        return user
+    
     try:
-        token = credentials.credentials
-        payload = verify_token(token, token_type="access")
-        user_id = UUID(payload.get("sub"))
+        # Tokens seen recently by any worker skip verification, but never a
+        # revocation: logout in another worker (or one racing the entry
+        # being written) only updates the blacklist
+        identity = await auth_cache.get(credentials.credentials)
+        if identity is not None:
+            if await token_blacklist.is_revoked(
+                identity.get("jti"), identity["id"], identity.get("iat")
+            ):
+                raise AuthenticationError(message="Token has been revoked")
+            user_id = UUID(identity["id"])
+        else:
+            payload = await _verify_access_token(credentials)
+            user_id = UUID(payload.get("sub"))
         
-        user = db.query(User).filter(User.id == user_id).first()
+        # Always a fully loaded row (no lazy loads on the async session)
+        user = await user_cache.aget(db, user_id)
         
         if user is None:
             raise HTTPException(
@@ -50,6 +106,13 @@ async def get_current_user(
                 detail="User not found"
             )
         
+        if identity is None:
+            await auth_cache.set(
+                credentials.credentials,
+                {"id": str(user_id), "jti": payload.get("jti"), "iat": payload.get("iat")},
+                payload["exp"]
+            )
+        request.state.current_user = user
         return user
         
     except AuthenticationError as e:
@@ -64,6 +127,63 @@ async def get_current_user(
         )
 
 
+async def get_current_user(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    FastAPI dependency to get the current authenticated user from JWT token.
+    
+    Args:
+        request: Current request
+        credentials: HTTP Bearer token credentials
+        db: Database session
+        
+    Returns:
+        User: Current authenticated user
+        
+    Raises:
+        HTTPException: If authentication fails (401)
+    """
+    return await _resolve_user(request, credentials, db)
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> Principal:
+    """
+    FastAPI dependency to get the current caller from JWT claims alone.
+    
+    Unlike get_current_user, this does not query the database. Use it for
+    endpoints that only need the caller's ID, username, role or status;
+    use get_current_user when the ORM row itself is required.
+    
+    Args:
+        credentials: HTTP Bearer token credentials
+        
+    Returns:
+        Principal: Current authenticated caller
+        
+    Raises:
+        HTTPException: If authentication fails (401)
+    """
+    try:
+        payload = await _verify_access_token(credentials)
+        return Principal.from_claims(payload)
+        
+    except AuthenticationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Invalid token format: {str(e)}"
+        )
+
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -90,11 +210,10 @@ async def get_current_active_user(
     return current_user
 
 
-def get_optional_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(
-        HTTPBearer(auto_error=False)
-    ),
-    db: Session = Depends(get_db)
+async def get_optional_current_user(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: AsyncSession = Depends(get_async_db)
 ) -> Optional[User]:
     """
     FastAPI dependency to optionally get the current user (does not raise error if missing).
@@ -102,6 +221,7 @@ def get_optional_current_user(
     Useful for endpoints that work both with and without authentication.
     
     Args:
+        request: Current request
         credentials: Optional HTTP Bearer token credentials
         db: Database session
         
@@ -112,12 +232,6 @@ def get_optional_current_user(
         return None
     
     try:
-        token = credentials.credentials
-        payload = verify_token(token, token_type="access")
-        user_id = UUID(payload.get("sub"))
-        
-        user = db.query(User).filter(User.id == user_id).first()
-        return user
-        
-    except (AuthenticationError, ValueError, TypeError):
+        return await _resolve_user(request, credentials, db)
+    except HTTPException:
         return None
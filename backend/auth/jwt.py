@@ -5,46 +5,186 @@ This module provides JWT token generation, validation, decoding,
 and related utilities for authentication.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional
-from jose import JWTError, jwt
+import base64
+import hashlib
+import hmac
+import time
+import uuid
+from datetime import timedelta
+from typing import Any, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+import jwt
+import orjson
+from jwt import PyJWTError as JWTError
+from jwt.algorithms import get_default_algorithms
 from uuid import UUID
 
+from backend.auth.jwt_cache import cache_payload, get_cached_payload, token_digest
 from backend.core.config import settings
 from backend.utils.exceptions import AuthenticationError
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+# Algorithm is fixed at startup; decode takes the allow-list as a list
+_ALG = settings.jwt_algorithm
+_ALGORITHMS = [_ALG]
+
+
+def _load_keys() -> Tuple[Any, Any]:
     """
-    Create a JWT access token.
+    Parse the signing and verification keys once for the configured algorithm.
+    
+    HMAC algorithms use the shared secret for both. Asymmetric algorithms
+    sign with the private key PEM in jwt_secret_key and verify with
+    jwt_public_key, derived from the private key when not configured.
+    Keys are returned as prepared key objects so PyJWT does not re-parse
+    PEMs on every encode/decode.
+    
+    Returns:
+        Tuple of (signing key, verification key)
+        
+    Raises:
+        RuntimeError: If the configured algorithm is not available
+    """
+    algorithms = get_default_algorithms()
+    if _ALG not in algorithms:
+        # RSA/EC/EdDSA are only registered when PyJWT[crypto] is installed
+        raise RuntimeError(
+            f"JWT algorithm {_ALG} is not supported "
+            f"(asymmetric algorithms require PyJWT[crypto])"
+        )
+    algorithm = algorithms[_ALG]
+    
+    if _ALG.startswith("HS"):
+        key = algorithm.prepare_key(settings.jwt_secret_key)
+        return key, key
+    
+    private_key = algorithm.prepare_key(settings.jwt_secret_key)
+    
+    if settings.jwt_public_key:
+        return private_key, algorithm.prepare_key(settings.jwt_public_key)
+    
+    return private_key, private_key.public_key()
+
+
+_SIGNING_KEY, _VERIFY_KEY = _load_keys()
+
+# Fast-path HMAC verification for tokens this service minted. The expected
+# header segment is taken from a real token so it matches PyJWT's encoding.
+_HMAC_HASHES = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_FAST_HASH = _HMAC_HASHES.get(_ALG)
+_EXPECTED_HEADER = (
+    jwt.encode({}, _SIGNING_KEY, algorithm=_ALG).split(".", 1)[0]
+    if _FAST_HASH is not None else None
+)
+
+# Claims PyJWT validates that the fast path does not; tokens carrying them
+# always take the full decode
+_FULL_DECODE_CLAIMS = ("nbf", "aud", "iss")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _fast_decode(token: str) -> Optional[dict]:
+    """
+    Verify a well-formed, unexpired HMAC token without a full PyJWT decode.
+    
+    Only handles the common case: exactly our header, a valid signature
+    and an integer 'exp' still in the future. Anything else (including
+    invalid signatures) returns None so the caller falls back to
+    jwt.decode, which produces the proper error.
     
     Args:
-        data: Dictionary containing token payload (should include 'sub', 'username', 'role')
-        expires_delta: Optional timedelta for expiration (defaults to configured access token expiry)
+        token: JWT token string
         
     Returns:
-        Encoded JWT token string
+        Verified payload, or None if the fast path does not apply
     """
-    to_encode = data.copy()
+    if _EXPECTED_HEADER is None:
+        return None
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+    header, sep, rest = token.partition(".")
+    if not sep or header != _EXPECTED_HEADER:
+        return None
+    
+    body, sep, signature = rest.partition(".")
+    if not sep or "." in signature:
+        return None
+    
+    try:
+        expected = hmac.new(_VERIFY_KEY, f"{header}.{body}".encode(), _FAST_HASH).digest()
+        if not hmac.compare_digest(expected, _b64url_decode(signature)):
+            return None
+        payload = orjson.loads(_b64url_decode(body))
+    except (ValueError, TypeError):
+        return None
+    
+    if not isinstance(payload, dict):
+        return None
+    
+    exp = payload.get("exp")
+    if type(exp) is not int or exp <= time.time():
+        return None
+    
+    if "iat" in payload and type(payload["iat"]) is not int:
+        return None
+    
+    if any(claim in payload for claim in _FULL_DECODE_CLAIMS):
+        return None
+    
+    return payload
+
+
+def _mint(data: dict, ttl_seconds: int, token_type: str) -> str:
+    """
+    Sign a JWT with standard time, ID and type claims.
+    
+    Args:
+        data: Dictionary containing token payload
+        ttl_seconds: Token lifetime in seconds
+        token_type: Token type claim ("access" or "refresh")
+        
+    Returns:
+        Encoded JWT token string
+    """
+    # NumericDate claims as ints, read from the clock once per token
+    now = int(time.time())
     
+    to_encode = data.copy()
     to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "access"
+        "exp": now + ttl_seconds,
+        "iat": now,
+        "jti": uuid.uuid4().hex,
+        "type": token_type
     })
     
-    encoded_jwt = jwt.encode(
+    return jwt.encode(
         to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm
+        _SIGNING_KEY,
+        algorithm=_ALG
     )
+
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+    """
+    Create a JWT access token.
     
-    return encoded_jwt
+    Args:
+        data: Dictionary containing token payload (should include 'sub', 'username',
+            'role' and 'is_active' so the caller can be authorized from claims alone)
+        expires_delta: Optional timedelta for expiration (defaults to configured access token expiry)
+        
+    Returns:
+        Encoded JWT token string
+    """
+    if expires_delta:
+        ttl_seconds = int(expires_delta.total_seconds())
+    else:
+        ttl_seconds = settings.jwt_access_token_expire_minutes * 60
+    
+    return _mint(data, ttl_seconds, "access")
 
 
 def create_refresh_token(data: dict) -> str:
@@ -57,29 +197,16 @@ def create_refresh_token(data: dict) -> str:
     Returns:
         Encoded JWT refresh token string
     """
-    to_encode = data.copy()
-    
-    expire = datetime.utcnow() + timedelta(days=settings.jwt_refresh_token_expire_days)
-    
-    to_encode.update({
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "type": "refresh"
-    })
-    
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm
-    )
-    
-    return encoded_jwt
+    return _mint(data, settings.jwt_refresh_token_expire_days * 86400, "refresh")
 
 
 def verify_token(token: str, token_type: str = "access") -> dict:
     """
     Verify and decode a JWT token.
     
+    Successfully verified payloads are cached briefly (see jwt_cache),
+    so repeated presentations of the same token skip signature checks.
+    
     Args:
         token: JWT token string to verify
         token_type: Expected token type ("access" or "refresh")
@@ -90,31 +217,87 @@ def verify_token(token: str, token_type: str = "access") -> dict:
     Raises:
         AuthenticationError: If token is invalid, expired, or wrong type
     """
-    try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm]
-        )
-        
-        # Verify token type
-        if payload.get("type") != token_type:
-            raise AuthenticationError(
-                message=f"Invalid token type. Expected {token_type}, got {payload.get('type')}"
+    key = token_digest(token)
+    cached = get_cached_payload(key, token_type)
+    if cached is not None:
+        return cached
+    
+    payload = _fast_decode(token)
+    if payload is None:
+        try:
+            payload = jwt.decode(
+                token,
+                _VERIFY_KEY,
+                algorithms=_ALGORITHMS
             )
-        
-        # Check if token has required fields
-        if "sub" not in payload:
+        except JWTError as e:
             raise AuthenticationError(
-                message="Token missing required 'sub' field"
+                message=f"Invalid token: {str(e)}"
             )
-        
-        return payload
-        
-    except JWTError as e:
+    
+    # Verify token type
+    if payload.get("type") != token_type:
+        raise AuthenticationError(
+            message=f"Invalid token type. Expected {token_type}, got {payload.get('type')}"
+        )
+    
+    # Check if token has required fields
+    if "sub" not in payload:
         raise AuthenticationError(
-            message=f"Invalid token: {str(e)}"
+            message="Token missing required 'sub' field"
         )
+    
+    cache_payload(key, payload)
+    return payload
+
+
+def verify_token_safe(
+    token: str,
+    token_type: str = "access"
+) -> Tuple[bool, Optional[dict], Optional[str]]:
+    """
+    Verify a JWT token, reporting failure as a value instead of raising.
+    
+    Intended for endpoints where invalid tokens are routine (e.g. refresh
+    under token spam), so rejections don't go through exception handlers
+    that log tracebacks.
+    
+    Args:
+        token: JWT token string to verify
+        token_type: Expected token type ("access" or "refresh")
+        
+    Returns:
+        Tuple of (valid, payload or None, error message or None)
+    """
+    try:
+        return True, verify_token(token, token_type), None
+    except AuthenticationError as e:
+        return False, None, e.message
+
+
+async def averify_token(token: str, token_type: str = "access") -> dict:
+    """
+    Verify and decode a JWT token without blocking the event loop.
+    
+    Signature verification is CPU-bound, so it is run in the threadpool
+    to keep async dependencies from serializing requests on the loop.
+    Cache hits are answered inline without a threadpool hop.
+    
+    Args:
+        token: JWT token string to verify
+        token_type: Expected token type ("access" or "refresh")
+        
+    Returns:
+        Decoded token payload as dictionary
+        
+    Raises:
+        AuthenticationError: If token is invalid, expired, or wrong type
+    """
+    cached = get_cached_payload(token_digest(token), token_type)
+    if cached is not None:
+        return cached
+    
+    return await run_in_threadpool(verify_token, token, token_type)
 
 
 def decode_token(token: str) -> dict:
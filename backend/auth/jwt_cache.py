@@ -0,0 +1,86 @@
+"""
+EVIDENT JWT Verification Cache
+
+This module caches decoded payloads of successfully verified JWTs for a
+short TTL, so tokens presented repeatedly skip signature verification
+and JSON decoding. Tokens are keyed by a digest, never stored raw, and
+tokens that fail verification are never cached.
+"""
+
+import hashlib
+import time
+from threading import Lock
+from typing import Optional
+
+from cachetools import TTLCache
+
+# Seconds a verified payload is reused; also capped at the token's "exp"
+PAYLOAD_CACHE_TTL = 30
+PAYLOAD_CACHE_MAX_SIZE = 10_000
+
+_payload_cache: TTLCache = TTLCache(maxsize=PAYLOAD_CACHE_MAX_SIZE, ttl=PAYLOAD_CACHE_TTL)
+
+# Digests of tokens revoked on logout. Kept for the payload TTL, so a
+# verification racing with logout cannot put the token back in the cache.
+_denylist: TTLCache = TTLCache(maxsize=PAYLOAD_CACHE_MAX_SIZE, ttl=PAYLOAD_CACHE_TTL)
+
+_lock = Lock()
+
+
+def token_digest(token: str) -> str:
+    """Return the cache key for a token."""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
+def get_cached_payload(key: str, token_type: str) -> Optional[dict]:
+    """
+    Look up a previously verified payload.
+    
+    Args:
+        key: Cache key from token_digest
+        token_type: Expected token type ("access" or "refresh")
+    
+    Returns:
+        Cached payload if present, unexpired and of the expected type, None otherwise
+    """
+    with _lock:
+        entry = _payload_cache.get(key)
+    
+    if entry is None:
+        return None
+    
+    expires_at, payload = entry
+    if time.time() >= expires_at or payload.get("type") != token_type:
+        return None
+    
+    return payload
+
+
+def cache_payload(key: str, payload: dict) -> None:
+    """
+    Store a verified payload.
+    
+    Args:
+        key: Cache key from token_digest
+        payload: Verified token payload
+    """
+    expires_at = payload.get("exp")
+    if not isinstance(expires_at, (int, float)):
+        return
+    
+    with _lock:
+        if key not in _denylist:
+            _payload_cache[key] = (expires_at, payload)
+
+
+def revoke_cached_payload(token: str) -> None:
+    """
+    Drop a token's cached payload and keep it from being cached again.
+    
+    Args:
+        token: JWT token string
+    """
+    key = token_digest(token)
+    with _lock:
+        _payload_cache.pop(key, None)
+        _denylist[key] = True
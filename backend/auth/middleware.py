@@ -6,14 +6,43 @@ Note: Most RBAC is handled via decorators and dependencies.
 This middleware can be used for global role/permission checks if needed.
 """
 
+import re
+from functools import lru_cache
 from fastapi import Request, HTTPException, status
 from starlette.middleware.base import BaseHTTPMiddleware
-from typing import Callable
+from typing import Callable, Iterable, Optional, Pattern
 
 from backend.utils.logger import StructuredLogger
 
 logger = StructuredLogger.get_logger()
 
+# Paths that never require authentication (exact match)
+PUBLIC_PATHS = frozenset(["/", "/health", "/docs", "/openapi.json", "/redoc"])
+
+# Path classifications returned by RBACMiddleware._classify
+PATH_PUBLIC = "public"
+PATH_AUTH = "auth"
+PATH_ADMIN = "admin"
+
+# Number of distinct paths whose classification is memoized per middleware
+CLASSIFY_CACHE_SIZE = 4096
+
+
+def _compile_prefixes(prefixes: Iterable[str]) -> Optional[Pattern[str]]:
+    """
+    Compile path prefixes into a single anchored regex.
+    
+    Args:
+        prefixes: Path prefixes to match
+        
+    Returns:
+        Compiled pattern matching any of the prefixes, or None if there are none
+    """
+    prefixes = list(prefixes)
+    if not prefixes:
+        return None
+    return re.compile("^(?:" + "|".join(re.escape(p) for p in prefixes) + ")")
+
 
 class RBACMiddleware(BaseHTTPMiddleware):
     """
@@ -42,6 +71,33 @@ class RBACMiddleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.protected_paths = protected_paths or ["/api/"]
         self.admin_only_paths = admin_only_paths or ["/api/admin/"]
+        
+        # Precompile prefix lists so dispatch does one match instead of a scan
+        self._public = PUBLIC_PATHS
+        self._protected_re = _compile_prefixes(self.protected_paths)
+        self._admin_re = _compile_prefixes(self.admin_only_paths)
+        
+        # Prefixes are fixed after init, so each path's classification is too;
+        # memoize per instance so steady-state requests skip the regex match
+        self._classify = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self._classify_path)
+    
+    def _classify_path(self, path: str) -> str:
+        """
+        Classify a request path by the access it requires.
+        
+        Args:
+            path: Request URL path
+            
+        Returns:
+            PATH_PUBLIC, PATH_AUTH or PATH_ADMIN
+        """
+        if self._protected_re is None or self._protected_re.match(path) is None:
+            return PATH_PUBLIC
+        
+        if self._admin_re is not None and self._admin_re.match(path) is not None:
+            return PATH_ADMIN
+        
+        return PATH_AUTH
     
     async def dispatch(self, request: Request, call_next: Callable):
         """
@@ -50,32 +106,23 @@ class RBACMiddleware(BaseHTTPMiddleware):
         Note: This is a basic implementation. Most RBAC checks
         should be done via decorators and dependencies in route handlers.
         """
+        path = request.url.path
+        
         # Skip RBAC checks for public endpoints
-        if request.url.path in ["/", "/health", "/docs", "/openapi.json", "/redoc"]:
+        if path in self._public:
             return await call_next(request)
         
-        # Check if path requires authentication
-        requires_auth = any(
-            request.url.path.startswith(path) for path in self.protected_paths
-        )
-        
-        if requires_auth:
-            # Check if path requires admin
-            requires_admin = any(
-                request.url.path.startswith(path) for path in self.admin_only_paths
+        if self._classify(path) == PATH_ADMIN:
+            # Admin-only paths are checked in route handlers via decorators
+            # This middleware just logs the attempt
+            logger.debug(
+                f"Admin-only path accessed: {path}",
+                extra={
+                    "path": path,
+                    "method": request.method,
+                    "event": "admin_path_access"
+                }
             )
-            
-            if requires_admin:
-                # Admin-only paths are checked in route handlers via decorators
-                # This middleware just logs the attempt
-                logger.debug(
-                    f"Admin-only path accessed: {request.url.path}",
-                    extra={
-                        "path": request.url.path,
-                        "method": request.method,
-                        "event": "admin_path_access"
-                    }
-                )
         
         # Continue to next middleware/route handler
         # Actual RBAC checks happen in route handlers via decorators
@@ -1,34 +1,60 @@
 """
 EVIDENT Password Reset Token Storage
 
-This module provides a simple in-memory storage for password reset tokens.
-For production, consider using a database table or Redis.
+This module provides storage for password reset tokens. Tokens are kept in
+Redis when REDIS_URL is configured, so they are shared across workers and
+survive restarts; otherwise a simple in-memory store is used, which is only
+correct for single-worker deployments.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Any
+import hashlib
+import heapq
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from threading import Lock
 
+import orjson
+
+from backend.core.config import settings
+from backend.core.redis_client import get_redis
+
+
+def _hash_token(token: str) -> str:
+    """
+    Return the storage key for a reset token.
+    
+    Tokens are high-entropy random strings, so a fast unkeyed hash is enough
+    to keep raw tokens out of storage while still allowing direct lookup.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=32).hexdigest()
+
 
 class PasswordResetTokenStore:
     """
     In-memory storage for password reset tokens.
     
-    Tokens expire after 1 hour (configurable).
+    Tokens expire after PASSWORD_RESET_TOKEN_EXPIRE_MINUTES. Expiry deadlines are
+    time.monotonic() floats, so they are unaffected by wall-clock changes,
+    and are also kept in a min-heap so cleanup only visits tokens that have
+    actually expired.
     """
     
-    def __init__(self, expiry_hours: int = 1):
+    # Run an opportunistic cleanup every this many stored tokens (power of two)
+    CLEANUP_INTERVAL = 256
+    
+    def __init__(self, expiry_minutes: int = 60):
         """
         Initialize token store.
         
         Args:
-            expiry_hours: Token expiry time in hours (default: 1)
+            expiry_minutes: Token expiry time in minutes (default: 60)
         """
         self._tokens: Dict[str, Dict[str, Any]] = {}
+        self._expiry: List[Tuple[float, str]] = []
         self._lock = Lock()
-        self.expiry_hours = expiry_hours
+        self.expiry_minutes = expiry_minutes
     
-    def store_token(self, token: str, user_id: str, email: str) -> None:
+    async def store_token(self, token: str, user_id: str, email: str) -> None:
         """
         Store a password reset token.
         
@@ -37,15 +63,22 @@ class PasswordResetTokenStore:
             user_id: User ID
             email: User email
         """
+        key = _hash_token(token)
+        expires_at = time.monotonic() + self.expiry_minutes * 60
+        
         with self._lock:
-            self._tokens[token] = {
+            self._tokens[key] = {
                 "user_id": user_id,
                 "email": email,
-                "expires_at": datetime.utcnow() + timedelta(hours=self.expiry_hours),
+                "expires_at": expires_at,
                 "used": False
             }
+            heapq.heappush(self._expiry, (expires_at, key))
+            
+            if len(self._expiry) & (self.CLEANUP_INTERVAL - 1) == 0:
+                self._remove_expired(time.monotonic())
     
-    def get_token_data(self, token: str) -> Optional[Dict[str, Any]]:
+    async def get_token_data(self, token: str) -> Optional[Dict[str, Any]]:
         """
         Get token data if valid and not expired.
         
@@ -55,15 +88,17 @@ class PasswordResetTokenStore:
         Returns:
             Token data dict with user_id and email, or None if invalid/expired
         """
+        key = _hash_token(token)
+        
         with self._lock:
-            if token not in self._tokens:
+            if key not in self._tokens:
                 return None
             
-            token_data = self._tokens[token]
+            token_data = self._tokens[key]
             
             # Check if expired
-            if datetime.utcnow() > token_data["expires_at"]:
-                del self._tokens[token]
+            if time.monotonic() > token_data["expires_at"]:
+                del self._tokens[key]
                 return None
             
             # Check if already used
@@ -72,27 +107,54 @@ class PasswordResetTokenStore:
             
             return token_data
     
-    def mark_token_used(self, token: str) -> None:
+    async def mark_token_used(self, token: str) -> None:
         """
         Mark a token as used.
         
         Args:
             token: Reset token
         """
+        key = _hash_token(token)
+        
         with self._lock:
-            if token in self._tokens:
-                self._tokens[token]["used"] = True
+            if key in self._tokens:
+                self._tokens[key]["used"] = True
     
-    def delete_token(self, token: str) -> None:
+    async def delete_token(self, token: str) -> None:
         """
         Delete a token.
         
         Args:
             token: Reset token
         """
+        key = _hash_token(token)
+        
         with self._lock:
-            if token in self._tokens:
-                del self._tokens[token]
+            if key in self._tokens:
+                del self._tokens[key]
+    
+    async def consume_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically fetch and invalidate a token.
+        
+        Args:
+            token: Reset token
+            
+        Returns:
+            Token data dict with user_id and email, or None if invalid/expired/used
+        """
+        key = _hash_token(token)
+        
+        with self._lock:
+            token_data = self._tokens.pop(key, None)
+            
+            if token_data is None or token_data["used"]:
+                return None
+            
+            if time.monotonic() > token_data["expires_at"]:
+                return None
+            
+            return token_data
     
     def cleanup_expired(self) -> int:
         """
@@ -102,17 +164,119 @@ class PasswordResetTokenStore:
             Number of tokens removed
         """
         with self._lock:
-            now = datetime.utcnow()
-            expired_tokens = [
-                token for token, data in self._tokens.items()
-                if now > data["expires_at"]
-            ]
+            return self._remove_expired(time.monotonic())
+    
+    def _remove_expired(self, now: float) -> int:
+        """
+        Pop expired entries off the expiry heap. Caller must hold the lock.
+        
+        Args:
+            now: Current time.monotonic() value
+            
+        Returns:
+            Number of tokens removed
+        """
+        removed = 0
+        while self._expiry and self._expiry[0][0] < now:
+            _, key = heapq.heappop(self._expiry)
+            token_data = self._tokens.get(key)
+            
+            # Skip tokens already deleted or consumed by get_token_data
+            if token_data is not None and now > token_data["expires_at"]:
+                del self._tokens[key]
+                removed += 1
+        
+        return removed
+
+
+class RedisPasswordResetTokenStore:
+    """
+    Redis-backed storage for password reset tokens.
+    
+    Each token is a single key with a TTL, so expiry is handled by Redis
+    and no cleanup or locking is needed. Tokens are single-use: marking a
+    token used deletes it.
+    """
+    
+    KEY_PREFIX = "prt:"
+    
+    def __init__(self, expiry_minutes: int = 60):
+        """
+        Initialize token store.
+        
+        Args:
+            expiry_minutes: Token expiry time in minutes (default: 60)
+        """
+        self.expiry_minutes = expiry_minutes
+    
+    def _key(self, token: str) -> str:
+        """Return the Redis key for a token (hashed, never the raw token)."""
+        return f"{self.KEY_PREFIX}{_hash_token(token)}"
+    
+    async def store_token(self, token: str, user_id: str, email: str) -> None:
+        """
+        Store a password reset token.
+        
+        Args:
+            token: Reset token
+            user_id: User ID
+            email: User email
+        """
+        await get_redis().set(
+            self._key(token),
+            orjson.dumps({"user_id": user_id, "email": email}),
+            ex=self.expiry_minutes * 60,
+            nx=True
+        )
+    
+    async def get_token_data(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get token data if valid and not expired.
+        
+        Args:
+            token: Reset token
             
-            for token in expired_tokens:
-                del self._tokens[token]
+        Returns:
+            Token data dict with user_id and email, or None if invalid/expired
+        """
+        raw = await get_redis().get(self._key(token))
+        return orjson.loads(raw) if raw is not None else None
+    
+    async def consume_token(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically fetch and invalidate a token (GETDEL, one round-trip).
+        
+        Args:
+            token: Reset token
             
-            return len(expired_tokens)
+        Returns:
+            Token data dict with user_id and email, or None if invalid/expired/used
+        """
+        raw = await get_redis().getdel(self._key(token))
+        return orjson.loads(raw) if raw is not None else None
+    
+    async def mark_token_used(self, token: str) -> None:
+        """
+        Mark a token as used. Tokens are single-use, so this deletes it.
+        
+        Args:
+            token: Reset token
+        """
+        await self.delete_token(token)
+    
+    async def delete_token(self, token: str) -> None:
+        """
+        Delete a token.
+        
+        Args:
+            token: Reset token
+        """
+        await get_redis().delete(self._key(token))
 
 
 # Global token store instance
-password_reset_store = PasswordResetTokenStore(expiry_hours=1)
+password_reset_store = (
+    RedisPasswordResetTokenStore(expiry_minutes=settings.password_reset_token_expire_minutes)
+    if settings.redis_url
+    else PasswordResetTokenStore(expiry_minutes=settings.password_reset_token_expire_minutes)
+)
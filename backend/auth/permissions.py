@@ -8,13 +8,20 @@ role-based access control at the endpoint level.
 from typing import Any
 from fastapi import Depends, HTTPException, status
 
-from backend.auth.dependencies import get_current_active_user
-from backend.core.rbac import RoleChecker
+from backend.auth.dependencies import get_current_principal
+from backend.auth.principal import Principal
+from backend.core.rbac import can_access_mission, has_permission, has_role_in, resolve_roles
 from backend.models.user import User
 from backend.utils.logger import StructuredLogger
 
 logger = StructuredLogger.get_logger()
 
+# All checks below authorize from token claims via the same
+# get_current_principal callable, so they never query the database and
+# FastAPI's per-request dependency cache verifies the token only once.
+# Role changes revoke the user's outstanding access tokens (see
+# token_blacklist.revoke_user), so stale role claims are not honored.
+
 
 def require_roles(*roles: str):
     """
@@ -34,8 +41,10 @@ def require_roles(*roles: str):
     Returns:
         FastAPI dependency function
     """
-    def role_check(current_user: User = Depends(get_current_active_user)) -> None:
-        if not RoleChecker.has_any_role(current_user, list(roles)):
+    allowed = resolve_roles(roles)
+    
+    def role_check(current_user: Principal = Depends(get_current_principal)) -> None:
+        if not has_role_in(current_user, allowed):
             logger.warning(
                 f"Access denied: User {current_user.username} lacks required roles: {roles}",
                 extra={
@@ -73,8 +82,8 @@ def require_permission(permission: str):
     Returns:
         FastAPI dependency function
     """
-    def permission_check(current_user: User = Depends(get_current_active_user)) -> None:
-        if not RoleChecker.has_permission(current_user, permission):
+    def permission_check(current_user: Principal = Depends(get_current_principal)) -> None:
+        if not has_permission(current_user, permission):
             logger.warning(
                 f"Access denied: User {current_user.username} lacks required permission: {permission}",
                 extra={
@@ -144,7 +153,7 @@ def check_mission_access(mission: str, user: User, db: Any = None) -> bool:
     Returns:
         True if user can access the mission, False otherwise
     """
-    return RoleChecker.can_access_mission(user, mission, db)
+    return can_access_mission(user, mission, db)
 
 
 # Alias for require_roles (for backward compatibility)
@@ -0,0 +1,60 @@
+"""
+EVIDENT Authenticated Principal
+
+This module defines the lightweight principal built from verified
+access-token claims, used by authorization checks that do not need
+the full User row.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from backend.models.user import UserRole
+
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    Authenticated caller identity derived purely from JWT claims.
+    
+    Exposes the same ``id``, ``username``, ``role`` and ``is_active``
+    attributes as User, so it can be passed to RoleChecker directly.
+    Claims reflect the user at token issue time; role or status changes
+    take effect when the access token is next refreshed.
+    
+    Attributes:
+        id: User ID (from the 'sub' claim)
+        username: Username
+        role: User role
+        is_active: Whether the user was active when the token was issued
+        jti: Unique token ID, used for revocation on logout
+    """
+    
+    id: UUID
+    username: str
+    role: UserRole
+    is_active: bool = True
+    jti: Optional[str] = None
+    
+    @classmethod
+    def from_claims(cls, payload: dict) -> "Principal":
+        """
+        Build a principal from a verified access-token payload.
+        
+        Args:
+            payload: Verified token payload
+            
+        Returns:
+            Principal instance
+            
+        Raises:
+            ValueError: If the 'sub' or 'role' claim is missing or malformed
+        """
+        return cls(
+            id=UUID(payload.get("sub")),
+            username=payload.get("username", ""),
+            role=UserRole(payload.get("role")),
+            is_active=bool(payload.get("is_active", True)),
+            jti=payload.get("jti"),
+        )
@@ -4,21 +4,36 @@ EVIDENT Authentication Routes
 This module defines all authentication-related API endpoints.
 """
 
+import asyncio
+import hashlib
+import logging
+import secrets
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict, Optional
+from uuid import UUID
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, case, func, insert, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
-from backend.core.database import get_db
+from backend.core.database import get_async_db
 from backend.core.security import (
     hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
+    verify_and_update_password_async,
     validate_password_strength_with_error,
     generate_password_reset_token
 )
-from backend.auth.jwt import create_access_token, create_refresh_token, verify_token
-from backend.auth.dependencies import get_current_active_user, security
+from backend.auth.auth_cache import auth_cache
+from backend.auth.jwt_cache import revoke_cached_payload
+from backend.auth.jwt import create_access_token, create_refresh_token, averify_token
+from backend.auth.dependencies import get_current_active_user, get_current_principal, security
+from backend.auth.principal import Principal
+from backend.auth.token_blacklist import token_blacklist
+from backend.auth.user_cache import user_cache
 from backend.auth.schemas import (
     LoginRequest,
     LoginResponse,
@@ -33,7 +48,10 @@ from backend.auth.schemas import (
     RoleInfo,
     RoleListResponse,
     AssignRoleRequest,
-    AssignRoleResponse
+    AssignRoleResponse,
+    BulkAssignRoleRequest,
+    BulkAssignRoleResponse,
+    BulkRoleAssignmentResult
 )
 from backend.auth.password_reset import password_reset_store
 from backend.auth.permissions import require_admin
@@ -45,11 +63,89 @@ from backend.utils.logger import StructuredLogger
 router = APIRouter(prefix="/api/auth", tags=["authentication"])
 logger = StructuredLogger.get_logger()
 
+# Verified against on unknown usernames so failed logins cost one hash either way
+_DUMMY_HASH = hash_password(secrets.token_urlsafe(32))
+
+# Email -> (user_id, username, email) of existing users, so bursts of reset
+# requests for one email skip the lookup. Unknown emails are never cached
+# (a user registering right after must be able to reset), and the short TTL
+# bounds how long a changed email or deactivated user is served stale.
+# Only touched from the event loop.
+_reset_email_cache: TTLCache = TTLCache(maxsize=100_000, ttl=10)
+
+# Email digest -> Future of the reset request currently being handled, so
+# concurrent requests for one email do the lookup and issuance only once
+_reset_inflight: Dict[str, asyncio.Future] = {}
+
+# Role lookup and validation message, built once
+_ROLE_BY_NAME = {r.value: r for r in UserRole}
+_VALID_ROLES_MSG = f"Invalid role. Must be one of: {[r.value for r in UserRole]}"
+
+# Lookups built once so each call skips constructing the statement
+# (column projections: no ORM instance needed)
+_LOGIN_USER_BY_USERNAME = select(
+    User.id,
+    User.username,
+    User.email,
+    User.full_name,
+    User.role,
+    User.is_active,
+    User.hashed_password
+).where(User.username == bindparam("username"))
+_RESET_USER_BY_EMAIL = select(User.id, User.username, User.email).where(
+    User.email == bindparam("email")
+)
+# Case-insensitive clash check for register; selects whether the username
+# (rather than the email) is the one taken
+_REGISTER_CONFLICT = select(
+    func.lower(User.username) == bindparam("username")
+).where(
+    or_(
+        func.lower(User.username) == bindparam("username"),
+        func.lower(User.email) == bindparam("email")
+    )
+).limit(1)
+
+# Built-in roles from UserRole, listed alongside database roles
+_BUILTIN_ROLES = tuple(
+    RoleInfo(name=r.value, description=f"Built-in {r.value} role", permissions={})
+    for r in UserRole
+)
+
+# Unique index -> 409 detail for duplicate registrations
+_UNIQUE_VIOLATION_DETAILS = {
+    "ix_users_username": "Username already exists",
+    "ix_users_email": "Email already exists",
+    "ux_users_username_lower": "Username already exists",
+    "ux_users_email_lower": "Email already exists",
+}
+
+
+def _constraint_name(error: IntegrityError) -> Optional[str]:
+    """
+    Get the name of the constraint behind an IntegrityError.
+    
+    Reads the driver's structured error field instead of parsing the message:
+    asyncpg exposes it on the wrapped exception, psycopg2 via ``diag``.
+    
+    Args:
+        error: IntegrityError raised by SQLAlchemy
+        
+    Returns:
+        Constraint name, or None if the driver did not report one
+    """
+    orig = getattr(error, "orig", None)
+    driver_error = getattr(orig, "__cause__", None) or orig
+    name = getattr(driver_error, "constraint_name", None)
+    if name is None:
+        name = getattr(getattr(orig, "diag", None), "constraint_name", None)
+    return name
+
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
 async def login(
     credentials: LoginRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> LoginResponse:
     """
     User login endpoint.
@@ -58,57 +154,75 @@ async def login(
     """
     try:
         # Find user by username
-        user = db.query(User).filter(User.username == credentials.username).first()
+        result = await db.execute(_LOGIN_USER_BY_USERNAME, {"username": credentials.username})
+        user = result.first()
         
         if user is None:
-            logger.warning(f"Login attempt with invalid username: {credentials.username}")
+            await verify_password_async(credentials.password, _DUMMY_HASH)
+            logger.warning("Login attempt with invalid username: %s", credentials.username)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid username or password"
+            )
+        
+        # Verify password (CPU-bound KDF, run off the event loop). This runs
+        # before the active check so every rejection costs one hash.
+        password_valid, new_hash = await verify_and_update_password_async(
+            credentials.password, user.hashed_password
+        )
+        if not password_valid:
+            logger.warning("Login attempt with invalid password for user: %s", user.username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid username or password"
             )
         
-        # Check if user is active
+        # Check if user is active (only revealed to callers with the password)
         if not user.is_active:
-            logger.warning(f"Login attempt for inactive user: {user.username}")
+            logger.warning("Login attempt for inactive user: %s", user.username)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User account is inactive"
             )
         
-        # Verify password
-        if not verify_password(credentials.password, user.hashed_password):
-            logger.warning(f"Login attempt with invalid password for user: {user.username}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid username or password"
+        # Upgrade legacy bcrypt hashes to Argon2id now that we have the password
+        if new_hash is not None:
+            await db.execute(
+                update(User).where(User.id == user.id).values(hashed_password=new_hash)
             )
+            await db.commit()
+            await user_cache.invalidate(user.id)
         
         # Generate tokens
         token_data = {
             "sub": str(user.id),
             "username": user.username,
-            "role": user.role.value
+            "role": user.role.value,
+            "is_active": user.is_active
         }
         
         access_token = create_access_token(data=token_data)
         refresh_token = create_refresh_token(data=token_data)
         
         # Log successful login
-        logger.info(
-            f"User logged in: {user.username}",
-            extra={
-                "user_id": str(user.id),
-                "username": user.username,
-                "event": "login"
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "User logged in: %s",
+                user.username,
+                extra={
+                    "user_id": str(user.id),
+                    "username": user.username,
+                    "event": "login"
+                }
+            )
         
         return LoginResponse(
             access_token=access_token,
             refresh_token=refresh_token,
             token_type="bearer",
-            user=UserInfo(
-                id=str(user.id),
+            # Fields come straight from DB columns; skip re-validation
+            user=UserInfo.model_construct(
+                id=user.id,
                 username=user.username,
                 email=user.email,
                 full_name=user.full_name,
@@ -120,7 +234,7 @@ async def login(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Login error: {str(e)}", exc_info=True)
+        logger.error("Login error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during login"
@@ -130,17 +244,34 @@ async def login(
 @router.post("/refresh", response_model=TokenResponse, status_code=status.HTTP_200_OK)
 async def refresh_token(
     request: TokenRefreshRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> TokenResponse:
     """
     Refresh access token using refresh token.
     """
+    # Rejections are expected traffic here: answer 401 directly instead of
+    # through the handler below, which logs a traceback. Verification runs
+    # in the threadpool (cached payloads are answered inline).
     try:
-        # Verify refresh token
-        payload = verify_token(request.refresh_token, token_type="refresh")
-        
-        user_id = payload.get("sub")
-        user = db.query(User).filter(User.id == user_id).first()
+        payload = await averify_token(request.refresh_token, token_type="refresh")
+    except AuthenticationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.message
+        )
+    
+    try:
+        user_id = UUID(payload["sub"])
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token"
+        )
+    
+    try:
+        # Read the row itself (not the user cache): the new token's role and
+        # status claims must reflect the latest changes
+        user = await db.get(User, user_id)
         
         if user is None or not user.is_active:
             raise HTTPException(
@@ -152,33 +283,31 @@ async def refresh_token(
         token_data = {
             "sub": str(user.id),
             "username": user.username,
-            "role": user.role.value
+            "role": user.role.value,
+            "is_active": user.is_active
         }
         
         access_token = create_access_token(data=token_data)
         
-        logger.info(
-            f"Token refreshed for user: {user.username}",
-            extra={
-                "user_id": str(user.id),
-                "event": "token_refresh"
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Token refreshed for user: %s",
+                user.username,
+                extra={
+                    "user_id": str(user.id),
+                    "event": "token_refresh"
+                }
+            )
         
         return TokenResponse(
             access_token=access_token,
             token_type="bearer"
         )
         
-    except AuthenticationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e.message)
-        )
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Token refresh error: {str(e)}", exc_info=True)
+        logger.error("Token refresh error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during token refresh"
@@ -187,22 +316,31 @@ async def refresh_token(
 
 @router.post("/logout", response_model=MessageResponse, status_code=status.HTTP_200_OK)
 async def logout(
-    current_user: User = Depends(get_current_active_user)
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    current_user: Principal = Depends(get_current_principal)
 ) -> MessageResponse:
     """
     Logout endpoint.
     
-    Note: Token invalidation (blacklisting) is not implemented in this phase.
-    For full logout functionality, implement token blacklisting in future phases.
+    Revokes the presented access token until it expires. Refresh tokens
+    are not revoked in this phase.
     """
-    logger.info(
-        f"User logged out: {current_user.username}",
-        extra={
-            "user_id": str(current_user.id),
-            "username": current_user.username,
-            "event": "logout"
-        }
-    )
+    payload = await averify_token(credentials.credentials, token_type="access")
+    if payload.get("jti"):
+        await token_blacklist.revoke(payload["jti"], payload["exp"])
+    revoke_cached_payload(credentials.credentials)
+    await auth_cache.delete(credentials.credentials)
+    
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "User logged out: %s",
+            current_user.username,
+            extra={
+                "user_id": str(current_user.id),
+                "username": current_user.username,
+                "event": "logout"
+            }
+        )
     
     return MessageResponse(message="Logged out successfully")
 
@@ -211,7 +349,7 @@ async def logout(
 async def register(
     user_data: RegisterRequest,
     current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> UserResponse:
     """
     User registration endpoint (admin-only).
@@ -221,7 +359,8 @@ async def register(
     # Check if current user is admin
     if current_user.role != UserRole.ADMIN:
         logger.warning(
-            f"Non-admin user attempted registration: {current_user.username}",
+            "Non-admin user attempted registration: %s",
+            current_user.username,
             extra={
                 "user_id": str(current_user.id),
                 "event": "unauthorized_registration_attempt"
@@ -242,33 +381,58 @@ async def register(
         )
     
     # Validate role
-    try:
-        role = UserRole(user_data.role.lower())
-    except ValueError:
+    role = _ROLE_BY_NAME.get(user_data.role.lower())
+    if role is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role. Must be one of: {[r.value for r in UserRole]}"
+            detail=_VALID_ROLES_MSG
+        )
+    
+    # Reject duplicates up front (index lookup) so the common conflict skips
+    # hashing and a failed INSERT; IntegrityError below still covers races
+    result = await db.execute(
+        _REGISTER_CONFLICT,
+        {"username": user_data.username.lower(), "email": user_data.email.lower()}
+    )
+    conflict = result.first()
+    if conflict is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Username already exists" if conflict[0] else "Email already exists"
         )
     
     # Create new user
     try:
-        hashed_password = hash_password(user_data.password)
-        
-        new_user = User(
-            username=user_data.username,
-            email=user_data.email,
-            hashed_password=hashed_password,
-            full_name=user_data.full_name,
-            role=role,
-            is_active=True
+        hashed_password = await hash_password_async(user_data.password)
+        
+        # Single INSERT ... RETURNING for the server-generated columns,
+        # instead of add/commit followed by a refresh SELECT
+        result = await db.execute(
+            insert(User)
+            .values(
+                username=user_data.username,
+                email=user_data.email,
+                hashed_password=hashed_password,
+                full_name=user_data.full_name,
+                role=role,
+                is_active=True
+            )
+            .returning(
+                User.id,
+                User.username,
+                User.email,
+                User.full_name,
+                User.role,
+                User.is_active,
+                User.created_at
+            )
         )
-        
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        new_user = result.one()
+        await db.commit()
         
         logger.info(
-            f"User registered by admin: {new_user.username}",
+            "User registered by admin: %s",
+            new_user.username,
             extra={
                 "user_id": str(new_user.id),
                 "username": new_user.username,
@@ -277,33 +441,25 @@ async def register(
             }
         )
         
-        return UserResponse(
-            id=str(new_user.id),
+        # Built from the INSERT ... RETURNING row; skip re-validation
+        return UserResponse.model_construct(
+            id=new_user.id,
             username=new_user.username,
             email=new_user.email,
             full_name=new_user.full_name,
             role=new_user.role.value,
             is_active=new_user.is_active,
-            created_at=new_user.created_at.isoformat()
+            created_at=new_user.created_at
         )
         
     except IntegrityError as e:
-        db.rollback()
-        error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+        await db.rollback()
+        detail = _UNIQUE_VIOLATION_DETAILS.get(_constraint_name(e))
+        if detail is not None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
         
-        if "username" in error_msg.lower() or "unique constraint" in error_msg.lower():
-            if "username" in error_msg.lower():
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Username already exists"
-                )
-            elif "email" in error_msg.lower():
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="Email already exists"
-                )
-        
-        logger.error(f"Registration error: {error_msg}", exc_info=True)
+        error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+        logger.error("Registration error: %s", error_msg, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User with this username or email already exists"
@@ -311,66 +467,101 @@ async def register(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
-        logger.error(f"Registration error: {str(e)}", exc_info=True)
+        await db.rollback()
+        logger.error("Registration error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during registration"
         )
 
 
-@router.post("/reset-password", response_model=MessageResponse, status_code=status.HTTP_200_OK)
-async def request_password_reset(
-    request: PasswordResetRequest,
-    db: Session = Depends(get_db)
-) -> MessageResponse:
+async def _issue_password_reset(user_id: str, username: str, email: str) -> None:
     """
-    Request password reset.
+    Generate and store a password reset token (runs after the response is sent).
     
-    Generates a reset token and stores it (email sending not implemented in this phase).
+    Args:
+        user_id: User ID
+        username: Username (for logging)
+        email: User email
     """
-    # Find user by email
-    user = db.query(User).filter(User.email == request.email).first()
-    
-    # Always return success message (security: don't reveal if email exists)
-    if user is None:
-        logger.warning(f"Password reset requested for non-existent email: {request.email}")
-        return MessageResponse(
-            message="If the email exists, a password reset link has been sent"
-        )
-    
     # Generate reset token
     reset_token = generate_password_reset_token()
     
     # Store token
-    password_reset_store.store_token(
+    await password_reset_store.store_token(
         token=reset_token,
-        user_id=str(user.id),
-        email=user.email
+        user_id=user_id,
+        email=email
     )
     
-    # TODO: Send email with reset link in future phases
-    # For now, log the token (in production, this should be sent via email)
+    # TODO: Send email with reset link in future phases (the token itself is
+    # never logged)
     logger.info(
-        f"Password reset requested for user: {user.username}",
+        "Password reset requested for user: %s",
+        username,
         extra={
-            "user_id": str(user.id),
-            "email": user.email,
-            "event": "password_reset_requested",
-            "reset_token": reset_token  # Remove this in production or send via secure channel
+            "user_id": user_id,
+            "email": email,
+            "event": "password_reset_requested"
         }
     )
+
+
+@router.post("/reset-password", response_model=MessageResponse, status_code=status.HTTP_200_OK)
+async def request_password_reset(
+    request: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db)
+) -> MessageResponse:
+    """
+    Request password reset.
     
-    # In production, send email instead of logging
-    return MessageResponse(
+    Generates a reset token and stores it (email sending not implemented in this phase).
+    Concurrent requests for the same email share a single lookup, repeated
+    requests for an existing user are answered from a seconds-long cache, and
+    token generation runs after the response is sent.
+    """
+    generic_response = MessageResponse(
         message="If the email exists, a password reset link has been sent"
     )
+    
+    # Concurrent requests for the same email wait for the one in flight
+    key = hashlib.blake2b(request.email.encode(), digest_size=8).hexdigest()
+    inflight = _reset_inflight.get(key)
+    if inflight is not None:
+        await inflight
+        return generic_response
+    
+    future = asyncio.get_running_loop().create_future()
+    _reset_inflight[key] = future
+    try:
+        # Find user by email (hits cached briefly to absorb reset floods)
+        user = _reset_email_cache.get(request.email)
+        if user is None:
+            result = await db.execute(_RESET_USER_BY_EMAIL, {"email": request.email})
+            row = result.first()
+            if row is not None:
+                user = (str(row.id), row.username, row.email)
+                _reset_email_cache[request.email] = user
+    finally:
+        future.set_result(None)
+        _reset_inflight.pop(key, None)
+    
+    # Always return success message (security: don't reveal if email exists)
+    if user is None:
+        logger.warning("Password reset requested for non-existent email: %s", request.email)
+        return generic_response
+    
+    background_tasks.add_task(_issue_password_reset, *user)
+    
+    # In production, send email instead of logging
+    return generic_response
 
 
 @router.post("/reset-password/confirm", response_model=MessageResponse, status_code=status.HTTP_200_OK)
 async def confirm_password_reset(
     request: PasswordResetConfirmRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> MessageResponse:
     """
     Confirm password reset with token.
@@ -384,8 +575,8 @@ async def confirm_password_reset(
             detail=e.message
         )
     
-    # Get token data
-    token_data = password_reset_store.get_token_data(request.token)
+    # Consume token (single-use; invalidated atomically so it cannot be replayed)
+    token_data = await password_reset_store.consume_token(request.token)
     
     if token_data is None:
         raise HTTPException(
@@ -393,11 +584,10 @@ async def confirm_password_reset(
             detail="Invalid or expired reset token"
         )
     
-    # Find user
-    user = db.query(User).filter(User.id == token_data["user_id"]).first()
+    # Find user (by primary key, served from the identity map when loaded)
+    user = await db.get(User, UUID(token_data["user_id"]))
     
     if user is None:
-        password_reset_store.delete_token(request.token)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid reset token"
@@ -405,14 +595,13 @@ async def confirm_password_reset(
     
     # Update password
     try:
-        user.hashed_password = hash_password(request.new_password)
-        db.commit()
-        
-        # Mark token as used
-        password_reset_store.mark_token_used(request.token)
+        user.hashed_password = await hash_password_async(request.new_password)
+        await db.commit()
+        await user_cache.invalidate(user.id)
         
         logger.info(
-            f"Password reset completed for user: {user.username}",
+            "Password reset completed for user: %s",
+            user.username,
             extra={
                 "user_id": str(user.id),
                 "event": "password_reset_completed"
@@ -422,8 +611,8 @@ async def confirm_password_reset(
         return MessageResponse(message="Password reset successfully")
         
     except Exception as e:
-        db.rollback()
-        logger.error(f"Password reset error: {str(e)}", exc_info=True)
+        await db.rollback()
+        logger.error("Password reset error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during password reset"
@@ -434,15 +623,16 @@ async def confirm_password_reset(
 
 @router.get("/admin/roles", response_model=RoleListResponse, status_code=status.HTTP_200_OK)
 async def list_roles(
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_principal),
     _: None = Depends(require_admin()),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> RoleListResponse:
     """
     List all available roles (admin-only).
     """
     try:
-        roles = db.query(Role).all()
+        result = await db.execute(select(Role))
+        roles = result.scalars().all()
         
         role_list = [
             RoleInfo(
@@ -453,34 +643,23 @@ async def list_roles(
             for role in roles
         ]
         
-        # Also include built-in roles from UserRole enum
-        built_in_roles = [
-            RoleInfo(
-                name=role.value,
-                description=f"Built-in {role.value} role",
-                permissions={}
-            )
-            for role in UserRole
-        ]
-        
-        # Combine and remove duplicates
-        all_roles = {role.name: role for role in role_list}
-        for role in built_in_roles:
-            if role.name not in all_roles:
-                all_roles[role.name] = role
+        # Also include built-in roles not overridden by a database role
+        db_names = {role.name for role in role_list}
+        role_list.extend(role for role in _BUILTIN_ROLES if role.name not in db_names)
         
         logger.info(
-            f"Roles listed by admin: {current_user.username}",
+            "Roles listed by admin: %s",
+            current_user.username,
             extra={
                 "user_id": str(current_user.id),
                 "event": "roles_listed"
             }
         )
         
-        return RoleListResponse(roles=list(all_roles.values()))
+        return RoleListResponse(roles=role_list)
         
     except Exception as e:
-        logger.error(f"List roles error: {str(e)}", exc_info=True)
+        logger.error("List roles error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while listing roles"
@@ -493,25 +672,24 @@ async def assign_role(
     request: AssignRoleRequest,
     current_user: User = Depends(get_current_active_user),
     _: None = Depends(require_admin()),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> AssignRoleResponse:
     """
     Assign a role to a user (admin-only).
     """
     try:
         # Validate role
-        try:
-            new_role = UserRole(request.role.lower())
-        except ValueError:
+        new_role = _ROLE_BY_NAME.get(request.role.lower())
+        if new_role is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid role. Must be one of: {[r.value for r in UserRole]}"
+                detail=_VALID_ROLES_MSG
             )
         
-        # Find target user
+        # Find target user (by primary key, served from the identity map when loaded)
         try:
-            target_user = db.query(User).filter(User.id == user_id).first()
-        except Exception:
+            target_user = await db.get(User, UUID(user_id))
+        except ValueError:
             target_user = None
         
         if target_user is None:
@@ -527,14 +705,21 @@ async def assign_role(
                 detail="Cannot remove admin role from yourself"
             )
         
-        # Update role
+        # Update role (the async session does not expire on commit, so no
+        # refresh round-trip is needed to read the user afterwards)
         old_role = target_user.role
         target_user.role = new_role
-        db.commit()
-        db.refresh(target_user)
+        await db.commit()
+        await user_cache.invalidate(target_user.id)
+        if new_role != old_role:
+            # Role checks read token claims; retire tokens carrying the old role
+            await token_blacklist.revoke_user(target_user.id)
         
         logger.info(
-            f"Role assigned by admin: {current_user.username} assigned {new_role.value} to {target_user.username}",
+            "Role assigned by admin: %s assigned %s to %s",
+            current_user.username,
+            new_role.value,
+            target_user.username,
             extra={
                 "admin_id": str(current_user.id),
                 "target_user_id": str(target_user.id),
@@ -553,9 +738,132 @@ async def assign_role(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
-        logger.error(f"Assign role error: {str(e)}", exc_info=True)
+        await db.rollback()
+        logger.error("Assign role error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error while assigning role"
         )
+
+
+@router.post("/admin/users/role/bulk", response_model=BulkAssignRoleResponse, status_code=status.HTTP_200_OK)
+async def bulk_assign_role(
+    request: BulkAssignRoleRequest,
+    current_user: User = Depends(get_current_active_user),
+    _: None = Depends(require_admin()),
+    db: AsyncSession = Depends(get_async_db)
+) -> BulkAssignRoleResponse:
+    """
+    Assign roles to many users in one request (admin-only).
+    
+    Valid assignments are applied with a single UPDATE and commit. Invalid
+    entries (unknown role or user, malformed ID, self-demotion) are
+    reported per user and do not prevent the others from being applied.
+    If a user appears more than once, the last entry wins.
+    """
+    # errors and pending are keyed by parsed UUID so that differently
+    # written IDs for the same user resolve to one entry
+    invalid_ids: dict = {}
+    errors: dict = {}
+    pending: dict = {}
+    
+    for item in request.assignments:
+        try:
+            target_id = UUID(item.user_id)
+        except ValueError:
+            invalid_ids[item.user_id] = f"User not found: {item.user_id}"
+            continue
+        
+        new_role = _ROLE_BY_NAME.get(item.role.lower())
+        if new_role is None:
+            error = _VALID_ROLES_MSG
+        elif target_id == current_user.id and new_role != UserRole.ADMIN:
+            error = "Cannot remove admin role from yourself"
+        else:
+            error = None
+        
+        if error is None:
+            errors.pop(target_id, None)
+            pending[target_id] = new_role
+        else:
+            errors[target_id] = error
+            pending.pop(target_id, None)
+    
+    try:
+        old_roles: dict = {}
+        if pending:
+            result = await db.execute(
+                select(User.id, User.role).where(User.id.in_(pending))
+            )
+            old_roles = dict(result.all())
+        
+        missing = pending.keys() - old_roles.keys()
+        for target_id in missing:
+            del pending[target_id]
+        
+        if pending:
+            await db.execute(
+                update(User)
+                .where(User.id.in_(pending))
+                .values(role=case(
+                    {uid: literal(role, User.role.type) for uid, role in pending.items()},
+                    value=User.id
+                ))
+            )
+            await db.commit()
+            
+            for target_id, role in pending.items():
+                await user_cache.invalidate(target_id)
+                if role != old_roles[target_id]:
+                    await token_blacklist.revoke_user(target_id)
+    except Exception as e:
+        await db.rollback()
+        logger.error("Bulk assign role error: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error while assigning roles"
+        )
+    
+    logger.info(
+        "Roles bulk-assigned by admin: %s updated %d users",
+        current_user.username,
+        len(pending),
+        extra={
+            "admin_id": str(current_user.id),
+            "changes": [
+                {
+                    "target_user_id": str(uid),
+                    "old_role": old_roles[uid].value,
+                    "new_role": role.value
+                }
+                for uid, role in pending.items()
+            ],
+            "failed": len(errors) + len(invalid_ids),
+            "event": "roles_bulk_assigned"
+        }
+    )
+    
+    results = []
+    for item in request.assignments:
+        error = invalid_ids.get(item.user_id)
+        if error is None:
+            target_id = UUID(item.user_id)
+            error = errors.get(target_id)
+            if error is None and target_id in missing:
+                error = f"User not found: {item.user_id}"
+        
+        if error is None:
+            results.append(BulkRoleAssignmentResult(
+                user_id=item.user_id,
+                success=True,
+                new_role=pending[target_id].value
+            ))
+        else:
+            results.append(BulkRoleAssignmentResult(
+                user_id=item.user_id, success=False, error=error
+            ))
+    
+    return BulkAssignRoleResponse(
+        message=f"Assigned roles to {len(pending)} of {len(request.assignments)} users",
+        results=results
+    )
@@ -5,8 +5,11 @@ This module defines Pydantic models for authentication-related
 requests and responses.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from datetime import datetime
 from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 
 class LoginRequest(BaseModel):
@@ -17,15 +20,14 @@ class LoginRequest(BaseModel):
 
 class UserInfo(BaseModel):
     """User information schema for responses."""
-    id: str = Field(..., description="User ID")
+    id: UUID = Field(..., description="User ID")
     username: str = Field(..., description="Username")
     email: str = Field(..., description="Email address")
     full_name: str = Field(..., description="Full name")
     role: str = Field(..., description="User role")
     is_active: bool = Field(..., description="Whether user is active")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LoginResponse(BaseModel):
@@ -58,16 +60,15 @@ class RegisterRequest(BaseModel):
 
 class UserResponse(BaseModel):
     """User response schema."""
-    id: str = Field(..., description="User ID")
+    id: UUID = Field(..., description="User ID")
     username: str = Field(..., description="Username")
     email: str = Field(..., description="Email address")
     full_name: str = Field(..., description="Full name")
     role: str = Field(..., description="User role")
     is_active: bool = Field(..., description="Whether user is active")
-    created_at: str = Field(..., description="Creation timestamp")
+    created_at: datetime = Field(..., description="Creation timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PasswordResetRequest(BaseModel):
@@ -92,8 +93,7 @@ class RoleInfo(BaseModel):
     description: str = Field(..., description="Role description")
     permissions: dict = Field(default_factory=dict, description="Role permissions")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoleListResponse(BaseModel):
@@ -111,3 +111,30 @@ class AssignRoleResponse(BaseModel):
     message: str = Field(..., description="Response message")
     user_id: str = Field(..., description="User ID")
     new_role: str = Field(..., description="New role assigned")
+
+
+class BulkRoleAssignment(BaseModel):
+    """Single entry of a bulk role assignment."""
+    user_id: str = Field(..., description="User ID")
+    role: str = Field(..., description="Role name to assign")
+
+
+class BulkAssignRoleRequest(BaseModel):
+    """Bulk assign role request schema."""
+    assignments: list[BulkRoleAssignment] = Field(
+        ..., min_length=1, max_length=1000, description="Role assignments to apply"
+    )
+
+
+class BulkRoleAssignmentResult(BaseModel):
+    """Outcome of a single bulk role assignment."""
+    user_id: str = Field(..., description="User ID")
+    success: bool = Field(..., description="Whether the role was assigned")
+    new_role: Optional[str] = Field(default=None, description="New role assigned")
+    error: Optional[str] = Field(default=None, description="Reason the assignment failed")
+
+
+class BulkAssignRoleResponse(BaseModel):
+    """Bulk assign role response schema."""
+    message: str = Field(..., description="Response message")
+    results: list[BulkRoleAssignmentResult] = Field(..., description="Per-user results, in request order")
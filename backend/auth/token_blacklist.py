@@ -0,0 +1,207 @@
+"""
+EVIDENT Token Blacklist
+
+This module provides storage for revoked access tokens, keyed by their
+'jti' claim, and for per-user revocations that reject every access token
+a user was issued before a given time (e.g. after a role change). Entries
+are kept only until the tokens would have expired anyway. Revocations are kept in Redis when REDIS_URL is configured, so a
+logout on one worker is honored by all of them; otherwise a simple
+in-memory store is used, which is only correct for single-worker
+deployments.
+"""
+
+import time
+from typing import Dict, Optional, Union
+from threading import Lock
+from uuid import UUID
+
+from backend.core.config import settings
+from backend.core.redis_client import get_redis
+
+
+class TokenBlacklist:
+    """
+    In-memory store of revoked token IDs.
+    """
+    
+    # Sweep expired entries once the store grows past this size
+    CLEANUP_THRESHOLD = 1024
+    
+    def __init__(self):
+        """
+        Initialize token blacklist.
+        """
+        self._revoked: Dict[str, float] = {}
+        self._users_revoked_at: Dict[str, float] = {}
+        self._lock = Lock()
+    
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke a token until its expiry time.
+        
+        Args:
+            jti: Token ID ('jti' claim)
+            expires_at: Token expiry as a Unix timestamp ('exp' claim)
+        """
+        if len(self._revoked) >= self.CLEANUP_THRESHOLD:
+            self.cleanup_expired()
+        
+        with self._lock:
+            self._revoked[jti] = float(expires_at)
+    
+    async def revoke_user(self, user_id: Union[UUID, str]) -> None:
+        """
+        Revoke every access token issued to a user before now.
+        
+        Args:
+            user_id: User ID ('sub' claim)
+        """
+        if len(self._users_revoked_at) >= self.CLEANUP_THRESHOLD:
+            self.cleanup_expired()
+        
+        with self._lock:
+            self._users_revoked_at[str(user_id)] = time.time()
+    
+    async def is_revoked(
+        self,
+        jti: Optional[str],
+        user_id: Optional[str] = None,
+        issued_at: Optional[float] = None
+    ) -> bool:
+        """
+        Check whether a token has been revoked.
+        
+        Args:
+            jti: Token ID ('jti' claim)
+            user_id: User ID ('sub' claim), to check per-user revocations
+            issued_at: Token issue time ('iat' claim), to check per-user revocations
+            
+        Returns:
+            True if the token is revoked and not yet expired, False otherwise
+        """
+        with self._lock:
+            if user_id is not None and issued_at is not None:
+                revoked_at = self._users_revoked_at.get(user_id)
+                if revoked_at is not None and issued_at < revoked_at:
+                    return True
+            
+            if jti is None:
+                return False
+            
+            expires_at = self._revoked.get(jti)
+            if expires_at is None:
+                return False
+            
+            if time.time() > expires_at:
+                del self._revoked[jti]
+                return False
+            
+            return True
+    
+    def cleanup_expired(self) -> int:
+        """
+        Remove entries for tokens that have expired.
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            now = time.time()
+            expired = [
+                jti for jti, expires_at in self._revoked.items()
+                if now > expires_at
+            ]
+            
+            for jti in expired:
+                del self._revoked[jti]
+            
+            # Tokens issued before a per-user revocation have all expired
+            # once an access token lifetime has passed
+            cutoff = now - settings.jwt_access_token_expire_minutes * 60
+            expired_users = [
+                user_id for user_id, revoked_at in self._users_revoked_at.items()
+                if revoked_at < cutoff
+            ]
+            
+            for user_id in expired_users:
+                del self._users_revoked_at[user_id]
+            
+            return len(expired) + len(expired_users)
+
+
+class RedisTokenBlacklist:
+    """
+    Redis-backed store of revoked token IDs.
+    
+    Each revocation is a single key whose TTL is the token's remaining
+    lifetime (or, for per-user revocations, the access token lifetime), so
+    expiry is handled by Redis and no cleanup is needed.
+    """
+    
+    KEY_PREFIX = "blk:"
+    USER_KEY_PREFIX = "blku:"
+    
+    async def revoke(self, jti: str, expires_at: float) -> None:
+        """
+        Revoke a token until its expiry time.
+        
+        Args:
+            jti: Token ID ('jti' claim)
+            expires_at: Token expiry as a Unix timestamp ('exp' claim)
+        """
+        ttl = int(expires_at - time.time()) + 1
+        if ttl <= 0:
+            return
+        
+        await get_redis().set(f"{self.KEY_PREFIX}{jti}", "1", ex=ttl)
+    
+    async def revoke_user(self, user_id: Union[UUID, str]) -> None:
+        """
+        Revoke every access token issued to a user before now.
+        
+        Args:
+            user_id: User ID ('sub' claim)
+        """
+        await get_redis().set(
+            f"{self.USER_KEY_PREFIX}{user_id}",
+            repr(time.time()),
+            ex=settings.jwt_access_token_expire_minutes * 60 + 1
+        )
+    
+    async def is_revoked(
+        self,
+        jti: Optional[str],
+        user_id: Optional[str] = None,
+        issued_at: Optional[float] = None
+    ) -> bool:
+        """
+        Check whether a token has been revoked.
+        
+        Both checks are answered with a single round trip.
+        
+        Args:
+            jti: Token ID ('jti' claim)
+            user_id: User ID ('sub' claim), to check per-user revocations
+            issued_at: Token issue time ('iat' claim), to check per-user revocations
+            
+        Returns:
+            True if the token is revoked and not yet expired, False otherwise
+        """
+        check_user = user_id is not None and issued_at is not None
+        if not check_user:
+            if jti is None:
+                return False
+            return bool(await get_redis().exists(f"{self.KEY_PREFIX}{jti}"))
+        
+        token_revoked, revoked_at = await get_redis().mget(
+            f"{self.KEY_PREFIX}{jti}",
+            f"{self.USER_KEY_PREFIX}{user_id}"
+        )
+        if token_revoked is not None and jti is not None:
+            return True
+        
+        return revoked_at is not None and issued_at < float(revoked_at)
+
+
+# Global token blacklist instance
+token_blacklist = RedisTokenBlacklist() if settings.redis_url else TokenBlacklist()
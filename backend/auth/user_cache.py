@@ -0,0 +1,187 @@
+"""
+EVIDENT User Cache
+
+This module provides a short-lived in-memory cache of User rows keyed by
+user ID, so authenticated requests can resolve the caller without a
+SELECT. Entries must be invalidated whenever a user's credentials, role
+or status change. When REDIS_URL is configured, invalidations are
+published so every worker drops its copy; otherwise they only reach the
+current process, which is only correct for single-worker deployments.
+"""
+
+import asyncio
+from threading import Lock
+from typing import Optional, Union
+from uuid import UUID
+
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend.core.config import settings
+from backend.core.redis_client import get_redis
+from backend.models.user import User
+from backend.utils.logger import StructuredLogger
+
+logger = StructuredLogger.get_logger()
+
+
+class UserCache:
+    """
+    In-memory TTL cache of detached User instances.
+    
+    The TTL bounds staleness if an invalidation message is missed (e.g.
+    while the subscriber reconnects to Redis).
+    """
+    
+    CHANNEL = "user_cache:invalidate"
+    
+    def __init__(self, broadcast: bool, maxsize: int = 10_000, ttl: int = 60):
+        """
+        Initialize user cache.
+        
+        Args:
+            broadcast: Whether to share invalidations between workers via Redis
+            maxsize: Maximum number of cached users
+            ttl: Seconds a cached user stays valid
+        """
+        self.broadcast = broadcast
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+        self._listener: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """
+        Start listening for invalidations published by other workers.
+        """
+        if self.broadcast and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+    
+    async def stop(self) -> None:
+        """
+        Stop the invalidation listener.
+        """
+        if self._listener is None:
+            return
+        
+        self._listener.cancel()
+        try:
+            await self._listener
+        except asyncio.CancelledError:
+            pass
+        self._listener = None
+    
+    async def _listen(self) -> None:
+        """
+        Drop cached users named on the invalidation channel, reconnecting on errors.
+        """
+        while True:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+                # Anything published while disconnected was missed
+                self.clear()
+                async for message in pubsub.listen():
+                    self._drop(message["data"])
+            except RedisError as e:
+                logger.warning("User cache subscriber failed: %s", e)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.close()
+    
+    def get(self, db: Session, user_id: Union[UUID, str]) -> Optional[User]:
+        """
+        Get a user by ID, querying the database only on a cache miss.
+        
+        The returned instance is attached to db (via merge without load),
+        so callers can use and modify it as if it had been queried.
+        
+        Args:
+            db: Database session
+            user_id: User ID
+        
+        Returns:
+            User or None if no such user exists
+        """
+        key = str(user_id)
+        
+        with self._lock:
+            cached = self._cache.get(key)
+        
+        if cached is None:
+            user = db.get(User, UUID(key))
+            if user is None:
+                return None
+            
+            # Keep a detached copy; the session gets its own instance below
+            db.expunge(user)
+            with self._lock:
+                self._cache[key] = user
+            cached = user
+        
+        return db.merge(cached, load=False)
+    
+    async def aget(self, db: AsyncSession, user_id: Union[UUID, str]) -> Optional[User]:
+        """
+        Async variant of get() for AsyncSession.
+        
+        Args:
+            db: Async database session
+            user_id: User ID
+        
+        Returns:
+            User or None if no such user exists
+        """
+        key = str(user_id)
+        
+        with self._lock:
+            cached = self._cache.get(key)
+        
+        if cached is None:
+            user = await db.get(User, UUID(key))
+            if user is None:
+                return None
+            
+            db.expunge(user)
+            with self._lock:
+                self._cache[key] = user
+            cached = user
+        
+        return await db.merge(cached, load=False)
+    
+    async def invalidate(self, user_id: Union[UUID, str]) -> None:
+        """
+        Drop a cached user in this and (when broadcasting) every other worker.
+        
+        Args:
+            user_id: User ID
+        """
+        self._drop(str(user_id))
+        
+        if not self.broadcast:
+            return
+        
+        try:
+            await get_redis().publish(self.CHANNEL, str(user_id))
+        except RedisError as e:
+            logger.warning("User cache invalidation publish failed: %s", e)
+    
+    def clear(self) -> None:
+        """
+        Drop all cached users in this process.
+        """
+        with self._lock:
+            self._cache.clear()
+    
+    def _drop(self, key: str) -> None:
+        """Drop a cached user in this process only."""
+        with self._lock:
+            self._cache.pop(key, None)
+
+
+# Global user cache instance
+user_cache = UserCache(
+    broadcast=bool(settings.redis_url),
+    ttl=settings.user_cache_ttl_seconds
+)
@@ -0,0 +1,250 @@
+"""
+EVIDENT Audit Log Writer
+
+This module takes audit log writes off the request path. Requests enqueue
+rows in memory; a background task drains the queue and writes each batch
+to audit_logs with a single COPY.
+"""
+
+import asyncio
+import io
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import orjson
+from starlette.concurrency import run_in_threadpool
+
+from backend.core.config import settings
+from backend.core.database import engine
+from backend.utils.logger import StructuredLogger
+
+logger = StructuredLogger.get_logger()
+
+# Columns written by COPY; id is generated by the database (uuidv7())
+AUDIT_COLUMNS = (
+    "user_id",
+    "query_text",
+    "retrieved_documents",
+    "answer",
+    "confidence_score",
+    "refusal_reason",
+    "sources",
+    "timestamp",
+    "response_time_ms",
+)
+
+# CSV's default NULL is an unquoted empty field; every other value is
+# quoted, so empty strings and literal "\N" text load as themselves
+_COPY_SQL = (
+    f"COPY audit_logs ({', '.join(AUDIT_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+
+def _copy_field(value: Any) -> str:
+    """
+    Encode one value as a COPY CSV field: None unquoted, all else quoted.
+    """
+    if value is None:
+        return ""
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+# Queued by stop() to tell the background task to flush and exit
+_STOP = object()
+
+
+class AuditLogWriter:
+    """
+    Batched audit log writer backed by an asyncio queue.
+    
+    Rows are flushed when a batch reaches batch_size or when the oldest
+    queued row has waited flush_interval seconds, whichever comes first.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = 1000,
+        flush_interval: float = 0.1,
+        max_queue_size: int = 100_000
+    ):
+        """
+        Initialize audit log writer.
+        
+        Args:
+            batch_size: Maximum rows written per COPY
+            flush_interval: Maximum seconds a row waits before being flushed
+            max_queue_size: Maximum rows buffered before new rows are dropped
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """
+        Start the background flush task on the running event loop.
+        """
+        if self._task is not None:
+            return
+        
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """
+        Stop the background task and flush any rows still queued.
+        
+        The task is signalled rather than cancelled so it can finish the
+        batch it is collecting (or writing) before it exits.
+        """
+        if self._task is None:
+            return
+        
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        
+        while not self._queue.empty():
+            await self._flush(self._take_batch([]))
+    
+    def log(
+        self,
+        user_id: UUID,
+        query_text: str,
+        response_time_ms: int,
+        retrieved_documents: Optional[List[Dict[str, Any]]] = None,
+        answer: Optional[str] = None,
+        confidence_score: Optional[float] = None,
+        refusal_reason: Optional[str] = None,
+        sources: Optional[List[Dict[str, Any]]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """
+        Queue an audit log row. Never blocks and never touches the database.
+        
+        Args:
+            user_id: User who made the query
+            query_text: The original query text
+            response_time_ms: Response time in milliseconds
+            retrieved_documents: Retrieved {document_id, chunk_id, score} objects
+            answer: Generated answer, or None if refused
+            confidence_score: Confidence score of the answer
+            refusal_reason: Reason for refusal
+            sources: Source citations
+            timestamp: Time of the query (defaults to now)
+        """
+        row = (
+            str(user_id),
+            query_text,
+            orjson.dumps(retrieved_documents or [], default=str).decode(),
+            answer,
+            confidence_score,
+            refusal_reason,
+            orjson.dumps(sources or [], default=str).decode(),
+            (timestamp or datetime.now(timezone.utc)).isoformat(),
+            response_time_ms,
+        )
+        
+        if self._queue is None:
+            logger.warning(
+                "Audit writer not started; dropping audit row",
+                extra={"event": "audit_dropped", "user_id": str(user_id)}
+            )
+            return
+        
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Audit queue full; dropping audit row",
+                extra={"event": "audit_dropped", "user_id": str(user_id)}
+            )
+    
+    def _take_batch(self, batch: List[tuple]) -> List[tuple]:
+        """
+        Move queued rows into batch without waiting, up to batch_size.
+        
+        Stops early at the stop marker, leaving it as the last item of batch.
+        """
+        while len(batch) < self.batch_size and not self._queue.empty():
+            row = self._queue.get_nowait()
+            batch.append(row)
+            if row is _STOP:
+                break
+        return batch
+    
+    async def _run(self) -> None:
+        """
+        Background loop: wait for a row, collect a batch, flush it.
+        
+        Returns after flushing the current batch once the stop marker is seen.
+        """
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                self._take_batch(batch)
+                remaining = deadline - loop.time()
+                if len(batch) >= self.batch_size or batch[-1] is _STOP or remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            
+            if batch[-1] is _STOP:
+                await self._flush(batch[:-1])
+                return
+            
+            await self._flush(batch)
+    
+    async def _flush(self, batch: List[tuple]) -> None:
+        """
+        Write a batch in the threadpool, logging (not raising) failures.
+        """
+        if not batch:
+            return
+        
+        try:
+            await run_in_threadpool(self._copy_rows, batch)
+        except Exception as e:
+            logger.error(
+                f"Failed to write {len(batch)} audit rows: {str(e)}",
+                exc_info=True,
+                extra={"event": "audit_flush_failed"}
+            )
+    
+    @staticmethod
+    def _copy_rows(batch: List[tuple]) -> None:
+        """
+        Write rows to audit_logs with a single COPY FROM STDIN.
+        """
+        buf = io.StringIO()
+        for row in batch:
+            buf.write(",".join(_copy_field(value) for value in row))
+            buf.write("\n")
+        buf.seek(0)
+        
+        conn = engine.raw_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.copy_expert(_COPY_SQL, buf)
+            conn.commit()
+        finally:
+            conn.close()
+
+
+# Global audit log writer instance (started/stopped with the application)
+audit_writer = AuditLogWriter(
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval_ms / 1000,
+    max_queue_size=settings.audit_queue_max_size
+)
@@ -19,17 +19,59 @@ class Settings(BaseSettings):
     app_name: str = "EVIDENT"
     app_version: str = "1.0.0"
     debug: bool = Field(default=False, description="Debug mode")
+    log_request_start: bool = Field(
+        default=True,
+        description="Log each request on arrival as well as on completion"
+    )
     
     # Database
     database_url: str = Field(
         ...,
         description="PostgreSQL database connection URL"
     )
+    db_pool_size: int = Field(
+        default=20,
+        description="Request-path connections kept open per host, split across server workers"
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        description="Extra request-path connections allowed per host under load, split across workers"
+    )
+    db_sync_pool_size: int = Field(
+        default=2,
+        description="Connections per worker for the sync engine (Alembic, scripts, audit COPY)"
+    )
+    db_pool_timeout: int = Field(
+        default=30,
+        description="Seconds to wait for a pooled connection before failing"
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are replaced"
+    )
+    db_pgbouncer: bool = Field(
+        default=False,
+        description="Connect through PgBouncer in transaction mode (no app-side pool or prepared statements)"
+    )
+    db_query_cache_size: int = Field(
+        default=1200,
+        description="Compiled SQL statements cached per engine (SQLAlchemy default: 500)"
+    )
+    
+    # Redis
+    redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis connection URL for shared state (in-memory fallback if unset)"
+    )
     
     # JWT Authentication
     jwt_secret_key: str = Field(
         ...,
-        description="Secret key for JWT token signing"
+        description="Secret key for JWT token signing (private key PEM for asymmetric algorithms)"
+    )
+    jwt_public_key: Optional[str] = Field(
+        default=None,
+        description="Public key PEM for verifying asymmetric tokens (derived from the private key if unset)"
     )
     jwt_algorithm: str = Field(
         default="HS256",
@@ -43,6 +85,40 @@ class Settings(BaseSettings):
         default=7,
         description="Refresh token expiration time in days"
     )
+    auth_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Maximum seconds a resolved user is cached per token in Redis"
+    )
+    user_cache_ttl_seconds: int = Field(
+        default=60,
+        description="Seconds a user row is cached in each worker's memory"
+    )
+    password_reset_token_expire_minutes: int = Field(
+        default=60,
+        description="Password reset token expiration time in minutes"
+    )
+    
+    # Password Hashing (changing these rehashes existing passwords on next login)
+    argon2_time_cost: int = Field(
+        default=2,
+        description="Argon2id iterations"
+    )
+    argon2_memory_cost_kib: int = Field(
+        default=19456,
+        description="Argon2id memory cost in KiB"
+    )
+    argon2_parallelism: int = Field(
+        default=1,
+        description="Argon2id parallel lanes"
+    )
+    bcrypt_cost: int = Field(
+        default=12,
+        description="bcrypt cost factor (legacy hashes only)"
+    )
+    password_hash_workers: Optional[int] = Field(
+        default=None,
+        description="Threads for password hashing (default: CPU count)"
+    )
     
     # Paths
     base_dir: Path = Path(__file__).parent.parent.parent
@@ -111,6 +187,20 @@ class Settings(BaseSettings):
         description="Overlap between chunks in tokens"
     )
     
+    # Audit Log Settings
+    audit_batch_size: int = Field(
+        default=1000,
+        description="Maximum audit rows written per COPY batch"
+    )
+    audit_flush_interval_ms: int = Field(
+        default=100,
+        description="Maximum time an audit row waits in the queue before flushing"
+    )
+    audit_queue_max_size: int = Field(
+        default=100_000,
+        description="Maximum number of audit rows buffered in memory"
+    )
+    
     # Server Settings
     host: str = Field(
         default="0.0.0.0",
@@ -120,12 +210,46 @@ class Settings(BaseSettings):
         default=8000,
         description="Server port"
     )
+    workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Server worker processes (default: CPU count with REDIS_URL, else 1; "
+            "always 1 in debug)"
+        )
+    )
+    
+    threadpool_size: int = Field(
+        default=64,
+        description="Shared threadpool size (sync endpoints, token verification, audit log writes)"
+    )
     
     # CORS Settings
     cors_origins: List[str] = Field(
         default=["http://localhost:3000"],
         description="Allowed CORS origins"
     )
+    cors_allow_methods: List[str] = Field(
+        default=["*"],
+        description="Allowed CORS request methods ('*' allows all)"
+    )
+    cors_allow_headers: List[str] = Field(
+        default=["*"],
+        description="Allowed CORS request headers ('*' allows all)"
+    )
+    
+    @property
+    def server_workers(self) -> int:
+        """
+        Number of server worker processes to run.
+        
+        Without Redis, reset tokens, the token blacklist and the auth caches
+        live in process memory, so only a single worker is correct.
+        """
+        if self.debug:
+            return 1
+        if self.workers:
+            return self.workers
+        return (os.cpu_count() or 1) if self.redis_url else 1
     
     class Config:
         env_file = ".env"
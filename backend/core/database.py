@@ -6,24 +6,85 @@ and provides FastAPI dependencies for database access.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.pool import NullPool
+from typing import AsyncGenerator, Generator
 
 from backend.core.config import settings
 
+
+def _pool_kwargs(pool_size: int, max_overflow: int) -> dict:
+    """
+    Engine pooling and statement cache arguments shared by the sync and async engines.
+    
+    Behind PgBouncer in transaction mode, PgBouncer owns the pool, so the
+    application opens a connection per checkout (NullPool) instead.
+    
+    Args:
+        pool_size: Connections kept open by this process's pool
+        max_overflow: Extra connections allowed beyond pool_size
+    """
+    # Compiled statements are cached per engine, so size it for every
+    # distinct query the app issues
+    common = {"query_cache_size": settings.db_query_cache_size}
+    
+    if settings.db_pgbouncer:
+        return {**common, "poolclass": NullPool}
+    
+    return {
+        **common,
+        "pool_pre_ping": True,  # Verify connections before using
+        "pool_size": pool_size,  # Number of connections to maintain
+        "max_overflow": max_overflow,  # Maximum number of connections beyond pool_size
+        "pool_timeout": settings.db_pool_timeout,  # Seconds to wait for a free connection
+        "pool_recycle": settings.db_pool_recycle,  # Replace connections before server/proxy idle limits
+    }
+
+
+# DB_POOL_SIZE/DB_MAX_OVERFLOW bound the request path for the whole host, so
+# each worker's async pool gets its share. The sync engine serves only
+# Alembic, scripts and the (single) audit COPY writer, so its pool stays
+# small: at most workers * (pool share + overflow share + sync pool) server
+# connections per host.
+_ASYNC_POOL_SIZE = max(1, settings.db_pool_size // settings.server_workers)
+_ASYNC_MAX_OVERFLOW = settings.db_max_overflow // settings.server_workers
+
 # Create database engine with connection pooling
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,  # Number of connections to maintain
-    max_overflow=20,  # Maximum number of connections beyond pool_size
     echo=settings.debug,  # Log SQL queries in debug mode
+    executemany_mode="values_plus_batch",  # Batch executemany UPDATE/DELETE too
+    **_pool_kwargs(settings.db_sync_pool_size, 0)
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) for request handlers; the sync engine above is kept
+# for Alembic, startup scripts and bulk COPY. asyncpg prepares statements
+# per connection, which breaks under PgBouncer transaction pooling, so its
+# statement caches are disabled in that mode.
+async_engine = create_async_engine(
+    make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+    echo=settings.debug,
+    connect_args=(
+        {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        if settings.db_pgbouncer else {}
+    ),
+    **_pool_kwargs(_ASYNC_POOL_SIZE, _ASYNC_MAX_OVERFLOW)
+)
+
+# Objects stay usable after commit without an implicit (blocking) refresh
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -42,6 +103,17 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for async database sessions.
+    
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db() -> None:
     """
     Initialize database by creating all tables.
@@ -55,3 +127,10 @@ def close_db() -> None:
     Close database connections.
     """
     engine.dispose()
+
+
+async def close_async_db() -> None:
+    """
+    Close async database connections.
+    """
+    await async_engine.dispose()
@@ -5,150 +5,243 @@ This module contains FastAPI middleware for request/response logging,
 error handling, CORS configuration, and request correlation IDs.
 """
 
+import logging
 import time
 import uuid
-from typing import Callable
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.core.config import settings
-from backend.utils.logger import StructuredLogger, get_request_id, set_request_id
+from backend.utils.logger import (
+    StructuredLogger,
+    log_error,
+    log_request,
+    log_response,
+    new_request_id,
+    reset_request_id,
+    set_request_id,
+)
 from backend.utils.exceptions import EVIDENTException
+from backend.utils.permcache import reset_request_cache, start_request_cache
 from backend.utils.responses import APIResponse
 
+# Whether arrival of each request is logged; the logger level is fixed at
+# startup, so this is decided once instead of building headers per request
+_LOG_REQUEST_START = (
+    settings.log_request_start
+    and StructuredLogger.get_logger().isEnabledFor(logging.INFO)
+)
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+# Both middlewares are plain ASGI callables rather than BaseHTTPMiddleware
+# subclasses, which would run each request in an extra task group and
+# pass the response body through an in-memory stream.
+
+
+class RequestLoggingMiddleware:
     """
     Middleware for logging HTTP requests and responses.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+        
+        Args:
+            app: Next ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and log request/response.
         
         Args:
-            request: FastAPI request object
-            call_next: Next middleware/handler to call
-            
-        Returns:
-            FastAPI response object
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Generate or get request ID
-        request_id = get_request_id()
-        request.state.request_id = request_id
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Generate a request ID (exposed as request.state.request_id)
+        request_id = new_request_id()
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
         
-        # Set request ID in logger context
-        set_request_id(request_id)
+        # Set request ID in logger context, restored once the request is done
+        request_id_token = set_request_id(request_id)
+        
+        # Fresh cache for permission checks made while handling this request
+        permission_cache_token = start_request_cache()
         
         # Extract user ID from request state (set by auth middleware)
-        user_id = getattr(request.state, "user_id", None)
+        user_id = state.get("user_id")
+        user_id = str(user_id) if user_id else None
+        
+        method = scope["method"]
+        path = scope["path"]
         
         # Log request
-        StructuredLogger.log_request(
-            method=request.method,
-            path=request.url.path,
-            headers=dict(request.headers),
-            query_params=dict(request.query_params),
-            user_id=str(user_id) if user_id else None
-        )
+        if _LOG_REQUEST_START:
+            query_string = scope["query_string"]
+            log_request(
+                method=method,
+                path=path,
+                headers=Headers(scope=scope),
+                query_params=dict(QueryParams(query_string)) if query_string else {},
+                user_id=user_id
+            )
+        
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add request ID to response headers
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
         
-        # Measure response time
-        start_time = time.time()
+        # Measure response time (monotonic clock)
+        start_time = time.perf_counter_ns()
         
         try:
             # Process request
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
             
             # Calculate duration
-            duration_ms = int((time.time() - start_time) * 1000)
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
+            duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
             
             # Log response
-            StructuredLogger.log_response(
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
+            log_response(
+                method=method,
+                path=path,
+                status_code=status_code,
                 duration_ms=duration_ms,
-                user_id=str(user_id) if user_id else None
+                user_id=user_id
             )
             
-            return response
-            
         except Exception as e:
             # Calculate duration even on error
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
             
             # Log error
-            StructuredLogger.log_error(
+            log_error(
                 error=e,
                 context={
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "duration_ms": duration_ms,
                 },
-                user_id=str(user_id) if user_id else None
+                user_id=user_id
             )
             
             # Re-raise to be handled by exception handler
             raise
+        
+        finally:
+            reset_request_cache(permission_cache_token)
+            reset_request_id(request_id_token)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """
     Middleware for handling exceptions and converting them to proper responses.
     """
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize middleware.
+        
+        Args:
+            app: Next ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and handle exceptions.
         
         Args:
-            request: FastAPI request object
-            call_next: Next middleware/handler to call
-            
-        Returns:
-            FastAPI response object
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
+            return
         except EVIDENTException as e:
+            # A response that has started cannot be replaced
+            if response_started:
+                raise
+            
             # Handle custom EVIDENT exceptions
-            error_response = APIResponse.error_response(
+            response = APIResponse.error_json(
                 message=e.message,
                 error=e.error_code,
-                details=e.details
-            )
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content=error_response.model_dump()
+                details=e.details,
+                status_code=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
+            if response_started:
+                raise
+            
             # Handle unexpected exceptions
-            StructuredLogger.log_error(
+            log_error(
                 error=e,
                 context={
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": scope["method"],
+                    "path": scope["path"],
                 }
             )
             
-            error_response = APIResponse.error_response(
+            response = APIResponse.error_json(
                 message="An unexpected error occurred",
                 error="INTERNAL_SERVER_ERROR",
                 details={
                     "error_type": type(e).__name__,
-                } if settings.debug else {}
-            )
-            
-            status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
-            return JSONResponse(
-                status_code=status_code,
-                content=error_response.model_dump()
+                } if settings.debug else {},
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+        
+        await response(scope, receive, send_wrapper)
+
+
+class _SetCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware with origins, methods and headers held in frozensets.
+    
+    Starlette keeps them as lists and tests membership on every request
+    (and per requested header on preflights); sets make each check O(1).
+    """
+    
+    def __init__(self, app: ASGIApp, **kwargs):
+        """
+        Initialize middleware.
+        
+        Args:
+            app: Next ASGI application
+            **kwargs: CORSMiddleware options
+        """
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+        self.allow_methods = frozenset(self.allow_methods)
+        self.allow_headers = frozenset(self.allow_headers)
 
 
 def setup_cors_middleware(app):
@@ -159,11 +252,11 @@ def setup_cors_middleware(app):
         app: FastAPI application instance
     """
     app.add_middleware(
-        CORSMiddleware,
+        _SetCORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=settings.cors_allow_methods,
+        allow_headers=settings.cors_allow_headers,
     )
 
 
@@ -5,12 +5,55 @@ This module provides core RBAC functionality for checking roles,
 permissions, and mission access.
 """
 
-from typing import List, Optional
+import functools
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from backend.models.user import User, UserRole
 from backend.models.document import Document
 from backend.models.role import DocumentPermission, PermissionType
+from backend.utils.permcache import cached, get_request_cache
+
+# Document permission types granting read access and modification
+_ACCESS_PERMISSION_TYPES = frozenset({
+    PermissionType.READ,
+    PermissionType.WRITE,
+    PermissionType.DELETE
+})
+_MODIFY_PERMISSION_TYPES = (PermissionType.WRITE, PermissionType.DELETE)
+
+# Role lookup by (lowercase) name, instead of UserRole(name) with try/except
+_ROLE_BY_NAME: Dict[str, UserRole] = {r.value: r for r in UserRole}
+
+
+def _request_memoized(kind: str) -> Callable:
+    """
+    Memoize a (user, document, db) check in the per-request permission cache.
+    
+    Results are keyed by check kind, user ID, role, active flag and document
+    ID, so a role change within the request is not answered from the memo.
+    
+    Args:
+        kind: Name distinguishing the check ("access", "modify")
+        
+    Returns:
+        Decorator for the check function
+    """
+    def decorator(check: Callable[[User, Document, Session], bool]) -> Callable:
+        @functools.wraps(check)
+        def wrapper(user: User, document: Document, db: Session) -> bool:
+            if not user:
+                return check(user, document, db)
+            
+            return cached(
+                (kind, user.id, user.role, user.is_active, document.id),
+                lambda: check(user, document, db)
+            )
+        
+        return wrapper
+    
+    return decorator
 
 
 class RoleChecker:
@@ -19,29 +62,30 @@ class RoleChecker:
     """
     
     # Role hierarchy: higher roles inherit permissions of lower roles
+    # (flattened: each role maps to every role it includes, for O(1) membership)
     ROLE_HIERARCHY = {
-        UserRole.ADMIN: [UserRole.ADMIN, UserRole.ENGINEER, UserRole.VIEWER],
-        UserRole.ENGINEER: [UserRole.ENGINEER, UserRole.VIEWER],
-        UserRole.VIEWER: [UserRole.VIEWER]
+        UserRole.ADMIN: frozenset({UserRole.ADMIN, UserRole.ENGINEER, UserRole.VIEWER}),
+        UserRole.ENGINEER: frozenset({UserRole.ENGINEER, UserRole.VIEWER}),
+        UserRole.VIEWER: frozenset({UserRole.VIEWER})
     }
     
-    # Permission mappings by role
+    # Permission mappings by role (immutable, shared by every check)
     ROLE_PERMISSIONS = {
-        UserRole.ADMIN: {
+        UserRole.ADMIN: frozenset({
             "users:read", "users:write", "users:delete",
             "documents:read", "documents:write", "documents:delete",
             "roles:read", "roles:write", "roles:delete",
             "missions:read", "missions:write", "missions:delete",
             "admin:access"
-        },
-        UserRole.ENGINEER: {
+        }),
+        UserRole.ENGINEER: frozenset({
             "documents:read", "documents:write",
             "missions:read"
-        },
-        UserRole.VIEWER: {
+        }),
+        UserRole.VIEWER: frozenset({
             "documents:read",
             "missions:read"
-        }
+        })
     }
     
     @staticmethod
@@ -59,11 +103,8 @@ class RoleChecker:
         if not user or not user.is_active:
             return False
         
-        try:
-            role_enum = UserRole(role.lower())
-            return user.role == role_enum
-        except ValueError:
-            return False
+        # Unknown names map to None and simply don't match
+        return user.role is _ROLE_BY_NAME.get(role.lower())
     
     @staticmethod
     def has_any_role(user: User, roles: List[str]) -> bool:
@@ -77,14 +118,39 @@ class RoleChecker:
         Returns:
             True if user has any of the roles, False otherwise
         """
-        if not user or not user.is_active:
-            return False
+        return has_role_in(user, resolve_roles(roles))
+    
+    @staticmethod
+    def resolve_roles(roles: Iterable[str]) -> FrozenSet[UserRole]:
+        """
+        Map role names to roles, ignoring unknown names.
         
-        for role in roles:
-            if RoleChecker.has_role(user, role):
-                return True
+        Callers checking the same names repeatedly should resolve them once
+        and use has_role_in.
         
-        return False
+        Args:
+            roles: Role names (case-insensitive)
+            
+        Returns:
+            Set of matching roles
+        """
+        return frozenset(
+            _ROLE_BY_NAME[name] for name in map(str.lower, roles) if name in _ROLE_BY_NAME
+        )
+    
+    @staticmethod
+    def has_role_in(user: User, roles: FrozenSet[UserRole]) -> bool:
+        """
+        Check if an active user has one of a pre-resolved set of roles.
+        
+        Args:
+            user: User object
+            roles: Roles from resolve_roles
+            
+        Returns:
+            True if user has any of the roles, False otherwise
+        """
+        return bool(user) and user.is_active and user.role in roles
     
     @staticmethod
     def has_permission(user: User, permission: str) -> bool:
@@ -104,13 +170,12 @@ class RoleChecker:
         if not user or not user.is_active:
             return False
         
-        # Admins have all permissions
-        if user.role == UserRole.ADMIN:
+        # Admins have all permissions (roles are UserRole members, so identity suffices)
+        if user.role is UserRole.ADMIN:
             return True
         
-        # Check role permissions
-        role_perms = RoleChecker.ROLE_PERMISSIONS.get(user.role, set())
-        return permission in role_perms
+        # Check role permissions (one hash lookup; unknown roles never match)
+        return (user.role, permission) in _ROLE_PERMISSION_PAIRS
     
     @staticmethod
     def can_access_mission(user: User, mission: Optional[str], db: Optional[Session] = None) -> bool:
@@ -147,10 +212,13 @@ class RoleChecker:
         return True
     
     @staticmethod
+    @_request_memoized("access")
     def can_access_document(user: User, document: Document, db: Session) -> bool:
         """
         Check if user can access a specific document.
         
+        Results are memoized for the rest of the current request.
+        
         - Admins can access all documents
         - Check document-level permissions
         - Check mission access
@@ -172,35 +240,23 @@ class RoleChecker:
             return True
         
         # Check mission access
-        if not RoleChecker.can_access_mission(user, document.mission, db):
+        if not can_access_mission(user, document.mission, db):
             return False
         
-        # Check document-level permissions
-        # First check user-specific permissions
-        user_permission = db.query(DocumentPermission).filter(
-            DocumentPermission.document_id == document.id,
-            DocumentPermission.user_id == user.id
-        ).first()
-        
-        if user_permission:
-            return user_permission.permission_type in [
-                PermissionType.READ,
-                PermissionType.WRITE,
-                PermissionType.DELETE
-            ]
-        
-        # Check role-based permissions
-        role_permission = db.query(DocumentPermission).filter(
+        # Check document-level permissions in one query: the user-specific
+        # row if any, otherwise the row for the user's role
+        permission_type = db.query(DocumentPermission.permission_type).filter(
             DocumentPermission.document_id == document.id,
-            DocumentPermission.role == user.role.value
-        ).first()
+            or_(
+                DocumentPermission.user_id == user.id,
+                DocumentPermission.role == user.role.value
+            )
+        ).order_by(
+            DocumentPermission.user_id.is_(None)
+        ).limit(1).scalar()
         
-        if role_permission:
-            return role_permission.permission_type in [
-                PermissionType.READ,
-                PermissionType.WRITE,
-                PermissionType.DELETE
-            ]
+        if permission_type is not None:
+            return permission_type in _ACCESS_PERMISSION_TYPES
         
         # Default: check role permissions
         # Engineers can read/write, viewers can only read
@@ -212,10 +268,85 @@ class RoleChecker:
         return False
     
     @staticmethod
+    def filter_accessible_documents(
+        user: User,
+        documents: List[Document],
+        db: Session
+    ) -> List[Document]:
+        """
+        Return the documents a user can access, checking all of them at once.
+        
+        Applies the same rules as can_access_document, but fetches the
+        document-level permissions for every document in a single query.
+        Results are added to the current request's memo, so later
+        can_access_document calls for these documents don't query again.
+        
+        Args:
+            user: User object
+            documents: Documents to check
+            db: Database session
+            
+        Returns:
+            Accessible documents, in their original order
+        """
+        if not user or not user.is_active:
+            return []
+        
+        if user.role == UserRole.ADMIN:
+            return list(documents)
+        
+        candidates = [
+            document for document in documents
+            if can_access_mission(user, document.mission, db)
+        ]
+        if not candidates:
+            return []
+        
+        # User-specific rows sort first, so they win over role rows
+        rows = db.query(
+            DocumentPermission.document_id,
+            DocumentPermission.permission_type
+        ).filter(
+            DocumentPermission.document_id.in_({document.id for document in candidates}),
+            or_(
+                DocumentPermission.user_id == user.id,
+                DocumentPermission.role == user.role.value
+            )
+        ).order_by(
+            DocumentPermission.user_id.is_(None)
+        ).all()
+        
+        permission_by_document: Dict = {}
+        for document_id, permission_type in rows:
+            permission_by_document.setdefault(document_id, permission_type)
+        
+        # Default when a document has no matching permission rows
+        default_allowed = user.role in (UserRole.ENGINEER, UserRole.VIEWER)
+        
+        cache = get_request_cache()
+        accessible = []
+        for document in candidates:
+            permission_type = permission_by_document.get(document.id)
+            if permission_type is not None:
+                allowed = permission_type in _ACCESS_PERMISSION_TYPES
+            else:
+                allowed = default_allowed
+            
+            if cache is not None:
+                cache[("access", user.id, user.role, user.is_active, document.id)] = allowed
+            if allowed:
+                accessible.append(document)
+        
+        return accessible
+    
+    @staticmethod
+    @_request_memoized("modify")
     def can_modify_document(user: User, document: Document, db: Session) -> bool:
         """
         Check if user can modify (write/delete) a specific document.
         
+        Results are memoized for the rest of the current request.
+        
         Args:
             user: User object
             document: Document object
@@ -232,34 +363,134 @@ class RoleChecker:
             return True
         
         # Check mission access
-        if not RoleChecker.can_access_mission(user, document.mission, db):
+        if not can_access_mission(user, document.mission, db):
             return False
         
-        # Check document-level permissions
-        user_permission = db.query(DocumentPermission).filter(
-            DocumentPermission.document_id == document.id,
-            DocumentPermission.user_id == user.id,
-            DocumentPermission.permission_type.in_([
-                PermissionType.WRITE,
-                PermissionType.DELETE
-            ])
-        ).first()
-        
-        if user_permission:
-            return True
-        
-        # Check role-based permissions
-        role_permission = db.query(DocumentPermission).filter(
-            DocumentPermission.document_id == document.id,
-            DocumentPermission.role == user.role.value,
-            DocumentPermission.permission_type.in_([
-                PermissionType.WRITE,
-                PermissionType.DELETE
-            ])
-        ).first()
-        
-        if role_permission:
+        # Check document-level permissions (user-specific or role) in one query
+        has_permission = db.query(
+            db.query(DocumentPermission.id).filter(
+                DocumentPermission.document_id == document.id,
+                or_(
+                    DocumentPermission.user_id == user.id,
+                    DocumentPermission.role == user.role.value
+                ),
+                DocumentPermission.permission_type.in_(_MODIFY_PERMISSION_TYPES)
+            ).exists()
+        ).scalar()
+        
+        if has_permission:
             return True
         
         # Default: engineers can modify, viewers cannot
         return user.role == UserRole.ENGINEER
+    
+    @staticmethod
+    def granted_document_ids(
+        user: User,
+        document_ids: Iterable,
+        permission_types: Iterable[PermissionType],
+        db: Session
+    ) -> Set:
+        """
+        Find which documents grant a user (directly or via role) a permission.
+        
+        One query for the whole batch, instead of one per document.
+        
+        Args:
+            user: User object
+            document_ids: Document IDs to check
+            permission_types: Permission types that count as a grant
+            db: Database session
+            
+        Returns:
+            Set of document IDs with a matching grant
+        """
+        document_ids = set(document_ids)
+        if not document_ids:
+            return set()
+        
+        rows = db.query(DocumentPermission.document_id).filter(
+            DocumentPermission.document_id.in_(document_ids),
+            or_(
+                DocumentPermission.user_id == user.id,
+                DocumentPermission.role == user.role.value
+            ),
+            DocumentPermission.permission_type.in_(tuple(permission_types))
+        ).distinct()
+        
+        return {document_id for (document_id,) in rows}
+    
+    @staticmethod
+    def filter_modifiable_documents(
+        user: User,
+        documents: List[Document],
+        db: Session
+    ) -> List[Document]:
+        """
+        Return the documents a user can modify, checking all of them at once.
+        
+        Applies the same rules as can_modify_document with at most one
+        query, and adds the results to the current request's memo.
+        
+        Args:
+            user: User object
+            documents: Documents to check
+            db: Database session
+            
+        Returns:
+            Modifiable documents, in their original order
+        """
+        if not user or not user.is_active:
+            return []
+        
+        if user.role == UserRole.ADMIN:
+            return list(documents)
+        
+        candidates = [
+            document for document in documents
+            if can_access_mission(user, document.mission, db)
+        ]
+        
+        # Engineers may modify by default, so only other roles need grants
+        if user.role == UserRole.ENGINEER:
+            granted = None
+        else:
+            granted = granted_document_ids(
+                user,
+                (document.id for document in candidates),
+                _MODIFY_PERMISSION_TYPES,
+                db
+            )
+        
+        cache = get_request_cache()
+        modifiable = []
+        for document in candidates:
+            allowed = granted is None or document.id in granted
+            if cache is not None:
+                cache[("modify", user.id, user.role, user.is_active, document.id)] = allowed
+            if allowed:
+                modifiable.append(document)
+        
+        return modifiable
+
+
+# Every (role, permission) pair granted by ROLE_PERMISSIONS
+_ROLE_PERMISSION_PAIRS = frozenset(
+    (role, permission)
+    for role, permissions in RoleChecker.ROLE_PERMISSIONS.items()
+    for permission in permissions
+)
+
+# Module-level aliases of the checks, so hot call sites use a plain global
+# instead of a class attribute lookup on every call
+has_role = RoleChecker.has_role
+has_any_role = RoleChecker.has_any_role
+resolve_roles = RoleChecker.resolve_roles
+has_role_in = RoleChecker.has_role_in
+has_permission = RoleChecker.has_permission
+can_access_mission = RoleChecker.can_access_mission
+can_access_document = RoleChecker.can_access_document
+filter_accessible_documents = RoleChecker.filter_accessible_documents
+can_modify_document = RoleChecker.can_modify_document
+granted_document_ids = RoleChecker.granted_document_ids
+filter_modifiable_documents = RoleChecker.filter_modifiable_documents
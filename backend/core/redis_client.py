@@ -0,0 +1,55 @@
+"""
+EVIDENT Redis Connection Management
+
+This module manages the shared Redis client used for state that must be
+consistent across workers (e.g. password reset tokens, revoked tokens).
+"""
+
+from typing import Optional
+
+import redis.asyncio as redis
+
+from backend.core.config import settings
+
+_redis: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """
+    Get the shared Redis client, creating it on first use.
+    
+    Returns:
+        Redis client
+        
+    Raises:
+        RuntimeError: If REDIS_URL is not configured
+    """
+    global _redis
+    
+    if _redis is None:
+        if not settings.redis_url:
+            raise RuntimeError("REDIS_URL is not configured")
+        _redis = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+    
+    return _redis
+
+
+async def init_redis() -> None:
+    """
+    Create the shared Redis client and verify connectivity at startup.
+    
+    Does nothing when REDIS_URL is not configured.
+    """
+    if settings.redis_url:
+        await get_redis().ping()
+
+
+async def close_redis() -> None:
+    """
+    Close the shared Redis client and its connection pool.
+    """
+    global _redis
+    
+    if _redis is not None:
+        await _redis.close()
+        _redis = None
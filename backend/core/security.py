@@ -5,20 +5,42 @@ This module provides password hashing, verification, validation,
 and other security-related utilities.
 """
 
-import re
+import asyncio
+import os
 import secrets
+import string
+from concurrent.futures import ThreadPoolExecutor
 from passlib.context import CryptContext
-from typing import Optional
+from typing import Optional, Tuple
 
+from backend.core.config import settings
 from backend.utils.exceptions import ValidationError
 
-# Create password context with bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
+# Create password context with Argon2id (parameters from settings). bcrypt
+# is kept only to verify legacy hashes; hashes that are bcrypt or use other
+# Argon2 parameters are upgraded on next login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.argon2_time_cost,
+    argon2__memory_cost=settings.argon2_memory_cost_kib,
+    argon2__parallelism=settings.argon2_parallelism,
+    bcrypt__rounds=settings.bcrypt_cost
+)
+
+# Dedicated threads for password hashing, so KDF work neither blocks the
+# event loop nor occupies the shared threadpool used by sync endpoints.
+# Sized to the CPU count by default, which also bounds Argon2 memory use.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers or os.cpu_count(),
+    thread_name_prefix="password-hash"
+)
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt.
+    Hash a password using Argon2id.
     
     Args:
         password: Plain text password to hash
@@ -49,6 +71,124 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a replacement hash if the stored one is outdated.
+    
+    Legacy bcrypt hashes (or Argon2 hashes with old parameters) verify as
+    usual and yield a new Argon2id hash the caller should persist.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to verify against
+        
+    Returns:
+        Tuple of (password matches, new hash or None if no upgrade is needed)
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the password hashing threads.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        Hashed password string
+        
+    Raises:
+        ValueError: If password is empty
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_executor, hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the password hashing threads.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to verify against
+        
+    Returns:
+        True if password matches, False otherwise
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, verify_password, plain_password, hashed_password
+    )
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Run verify_and_update_password on the password hashing threads.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Hashed password to verify against
+        
+    Returns:
+        Tuple of (password matches, new hash or None if no upgrade is needed)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _hash_executor, verify_and_update_password, plain_password, hashed_password
+    )
+
+
+# Character classes required by the password policy
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_SPECIAL_CHARACTERS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+# Policy failures in the order they are reported
+_PASSWORD_CLASS_ERRORS = (
+    "Password must contain at least one uppercase letter",
+    "Password must contain at least one lowercase letter",
+    "Password must contain at least one number",
+    "Password must contain at least one special character",
+)
+
+
+def _password_classes(password: str) -> Tuple[bool, bool, bool, bool]:
+    """
+    Scan a password once for each required character class.
+    
+    Args:
+        password: Password to scan
+        
+    Returns:
+        Tuple of (has uppercase, has lowercase, has digit, has special character)
+    """
+    has_upper = has_lower = has_digit = has_special = False
+    
+    for ch in password:
+        if ch in _UPPERCASE:
+            has_upper = True
+        elif ch in _LOWERCASE:
+            has_lower = True
+        elif ch.isdecimal():
+            has_digit = True
+        elif ch in _SPECIAL_CHARACTERS:
+            has_special = True
+        else:
+            continue
+        
+        if has_upper and has_lower and has_digit and has_special:
+            break
+    
+    return has_upper, has_lower, has_digit, has_special
+
+
 def validate_password_strength(password: str) -> bool:
     """
     Validate password strength according to requirements:
@@ -67,19 +207,7 @@ def validate_password_strength(password: str) -> bool:
     if len(password) < 8:
         return False
     
-    if not re.search(r'[A-Z]', password):
-        return False
-    
-    if not re.search(r'[a-z]', password):
-        return False
-    
-    if not re.search(r'\d', password):
-        return False
-    
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
-        return False
-    
-    return True
+    return all(_password_classes(password))
 
 
 def validate_password_strength_with_error(password: str) -> None:
@@ -104,29 +232,12 @@ def validate_password_strength_with_error(password: str) -> None:
             message="Password must be at least 8 characters long"
         )
     
-    if not re.search(r'[A-Z]', password):
-        raise ValidationError(
-            field="password",
-            message="Password must contain at least one uppercase letter"
-        )
-    
-    if not re.search(r'[a-z]', password):
-        raise ValidationError(
-            field="password",
-            message="Password must contain at least one lowercase letter"
-        )
-    
-    if not re.search(r'\d', password):
-        raise ValidationError(
-            field="password",
-            message="Password must contain at least one number"
-        )
-    
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
-        raise ValidationError(
-            field="password",
-            message="Password must contain at least one special character"
-        )
+    for present, message in zip(_password_classes(password), _PASSWORD_CLASS_ERRORS):
+        if not present:
+            raise ValidationError(
+                field="password",
+                message=message
+            )
 
 
 def generate_password_reset_token() -> str:
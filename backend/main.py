@@ -5,14 +5,18 @@ This module initializes the FastAPI application and sets up all routes,
 middleware, and configuration.
 """
 
+import anyio.to_thread
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from backend.core.config import settings
 from backend.core.middleware import setup_middleware
-from backend.core.database import init_db
+from backend.core.database import init_db, async_engine, close_async_db
+from backend.core.audit import audit_writer
+from backend.core.redis_client import init_redis, close_redis
 from backend.utils.logger import StructuredLogger
 from backend.auth.routes import router as auth_router
+from backend.auth.user_cache import user_cache
 
 # Initialize logger
 logger = StructuredLogger.get_logger()
@@ -22,7 +26,8 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Evidence-Grounded Intelligence for Document-Enabled Knowledge Systems",
-    debug=settings.debug
+    debug=settings.debug,
+    default_response_class=ORJSONResponse  # orjson instead of stdlib json for every route
 )
 
 # Set up middleware (CORS, error handling, logging)
@@ -45,6 +50,25 @@ async def startup_event():
         }
     )
     
+    # Widen the threadpool used by run_in_threadpool (sync endpoints, token
+    # verification, audit log writes) beyond the default 40-thread limit;
+    # password hashing runs on its own executor
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    
+    # Connect to Redis (shared reset tokens) so misconfiguration fails at startup
+    await init_redis()
+    
+    # Start background writer for batched audit log inserts
+    audit_writer.start()
+    
+    # Receive user cache invalidations published by other workers
+    user_cache.start()
+    
+    logger.info(
+        f"Database pool: {async_engine.pool.status()}",
+        extra={"event": "db_pool_status"}
+    )
+    
     # Database tables are created via Alembic migrations
     # Uncomment below if you need to create tables programmatically:
     # init_db()
@@ -57,9 +81,14 @@ async def shutdown_event():
         f"Shutting down {settings.app_name}",
         extra={"event": "application_shutdown"}
     )
+    
+    await audit_writer.stop()
+    await user_cache.stop()
+    await close_async_db()
+    await close_redis()
 
 
-@app.get("/", response_class=JSONResponse)
+@app.get("/")
 async def root():
     """Root endpoint."""
     return {
@@ -70,7 +99,7 @@ async def root():
     }
 
 
-@app.get("/health", response_class=JSONResponse)
+@app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {
@@ -82,9 +111,21 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
+    
+    if settings.server_workers > 1 and not settings.redis_url:
+        raise SystemExit(
+            "WORKERS > 1 requires REDIS_URL: reset tokens, revocations and "
+            "auth caches are per-process without Redis"
+        )
+    
+    # uvloop and httptools (C event loop and HTTP parser) ship with
+    # uvicorn[standard]; debug keeps a single reloading asyncio worker
     uvicorn.run(
         "backend.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug
+        reload=settings.debug,
+        loop="asyncio" if settings.debug else "uvloop",
+        http="httptools",
+        workers=settings.server_workers
     )
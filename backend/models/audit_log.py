@@ -4,11 +4,10 @@ EVIDENT Audit Log Model
 This module defines the AuditLog model for tracking all queries and actions.
 """
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Text, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, Index, Text, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 
 from backend.core.database import Base
 
@@ -21,12 +20,12 @@ class AuditLog(Base):
         id: Unique identifier (UUID)
         user_id: User ID who made the query (FK to User)
         query_text: The original query text
-        retrieved_documents: JSON array of retrieved document IDs and scores
+        retrieved_documents: JSONB array of retrieved document IDs and scores
         answer: The generated answer (nullable if refused)
         confidence_score: Confidence score of the answer (nullable)
         refusal_reason: Reason for refusal if answer was refused (nullable)
-        sources: JSON array of source citations
-        timestamp: Timestamp when query was made (indexed)
+        sources: JSONB array of source citations
+        timestamp: Timestamp when query was made (BRIN-indexed)
         response_time_ms: Response time in milliseconds
     """
     
@@ -35,21 +34,19 @@ class AuditLog(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        server_default=text("uuidv7()")
     )
     user_id = Column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     query_text = Column(
         Text,
         nullable=False
     )
     retrieved_documents = Column(
-        JSON,
+        JSONB,
         nullable=True,
         default=list,
         comment="Array of {document_id, chunk_id, score} objects"
@@ -70,7 +67,7 @@ class AuditLog(Base):
         comment="Reason for refusing to answer"
     )
     sources = Column(
-        JSON,
+        JSONB,
         nullable=True,
         default=list,
         comment="Array of source citations"
@@ -78,8 +75,7 @@ class AuditLog(Base):
     timestamp = Column(
         DateTime(timezone=True),
         server_default=func.now(),
-        nullable=False,
-        index=True
+        nullable=False
     )
     response_time_ms = Column(
         Integer,
@@ -93,3 +89,27 @@ class AuditLog(Base):
         "User",
         back_populates="audit_logs"
     )
+    
+    # Rows arrive in timestamp order, so a BRIN index covers time-range
+    # queries at a fraction of a B-tree's size and insert cost
+    __table_args__ = (
+        Index(
+            "ix_audit_logs_timestamp",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # A user's most recent entries; also serves plain user_id lookups
+        Index(
+            "ix_audit_logs_user_timestamp",
+            user_id,
+            timestamp.desc(),
+        ),
+        # Containment (@>) lookups of audit entries citing a given source
+        Index(
+            "ix_audit_logs_sources",
+            "sources",
+            postgresql_using="gin",
+            postgresql_ops={"sources": "jsonb_path_ops"},
+        ),
+    )
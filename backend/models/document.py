@@ -5,12 +5,13 @@ This module defines the Document and DocumentChunk models for document storage
 and retrieval.
 """
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Index, Text, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
+from pgvector.sqlalchemy import Vector
 
+from backend.core.config import settings
 from backend.core.database import Base
 
 
@@ -27,7 +28,7 @@ class Document(Base):
         project: Project name
         uploaded_by: User ID who uploaded the document (FK to User)
         uploaded_at: Timestamp when document was uploaded
-        metadata: Additional metadata as JSON
+        doc_metadata: Additional metadata as JSONB (column "metadata")
         total_chunks: Total number of chunks in the document
     """
     
@@ -36,8 +37,7 @@ class Document(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        server_default=text("uuidv7()")
     )
     title = Column(
         String(500),
@@ -72,8 +72,10 @@ class Document(Base):
         server_default=func.now(),
         nullable=False
     )
-    metadata = Column(
-        JSON,
+    # "metadata" is reserved by the declarative base; the column keeps its name
+    doc_metadata = Column(
+        "metadata",
+        JSONB,
         nullable=True,
         default=dict
     )
@@ -110,7 +112,7 @@ class DocumentChunk(Base):
         document_id: Document ID this chunk belongs to (FK to Document)
         chunk_index: Index of the chunk within the document
         text: The chunk text content
-        embedding: Embedding vector reference (for FAISS lookup)
+        embedding: Embedding vector (pgvector, HNSW-indexed for cosine similarity)
         start_char: Starting character position in original document
         end_char: Ending character position in original document
         created_at: Timestamp when chunk was created
@@ -121,14 +123,12 @@ class DocumentChunk(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        server_default=text("uuidv7()")
     )
     document_id = Column(
         UUID(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     chunk_index = Column(
         Integer,
@@ -139,9 +139,9 @@ class DocumentChunk(Base):
         nullable=False
     )
     embedding = Column(
-        Text,
+        Vector(settings.embedding_dimension),
         nullable=True,
-        comment="Reference to FAISS vector store index"
+        comment="Embedding vector for similarity search"
     )
     start_char = Column(
         Integer,
@@ -165,5 +165,16 @@ class DocumentChunk(Base):
     
     # Unique constraint on document_id and chunk_index
     __table_args__ = (
-        {"comment": "Document chunks with embeddings for vector search"}
+        UniqueConstraint(
+            "document_id",
+            "chunk_index",
+            name="uq_document_chunks_document_chunk"
+        ),
+        Index(
+            "ix_document_chunks_embedding",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        {"comment": "Document chunks with embeddings for vector search"},
     )
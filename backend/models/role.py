@@ -4,11 +4,10 @@ EVIDENT Role and Permission Models
 This module defines the Role and DocumentPermission models for access control.
 """
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Index, text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from backend.core.database import Base
@@ -29,16 +28,25 @@ class Role(Base):
         id: Unique identifier (UUID)
         name: Role name (unique)
         description: Role description
-        permissions: JSON object with permission mappings
+        permissions: JSONB object with permission mappings
     """
     
     __tablename__ = "roles"
     
+    # Containment (@>) lookups of roles granting a permission
+    __table_args__ = (
+        Index(
+            "ix_roles_permissions",
+            "permissions",
+            postgresql_using="gin",
+            postgresql_ops={"permissions": "jsonb_path_ops"},
+        ),
+    )
+    
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        server_default=text("uuidv7()")
     )
     name = Column(
         String(100),
@@ -50,7 +58,7 @@ class Role(Base):
         nullable=True
     )
     permissions = Column(
-        JSON,
+        JSONB,
         nullable=False,
         default=dict,
         comment="JSON object with permission mappings"
@@ -75,14 +83,12 @@ class DocumentPermission(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        server_default=text("uuidv7()")
     )
     document_id = Column(
         UUID(as_uuid=True),
         ForeignKey("documents.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
     user_id = Column(
         UUID(as_uuid=True),
@@ -95,8 +101,15 @@ class DocumentPermission(Base):
         nullable=True,
         comment="Role name if permission is role-based"
     )
+    # VARCHAR + CHECK of the lowercase values, matching the migrations
     permission_type = Column(
-        Enum(PermissionType),
+        Enum(
+            PermissionType,
+            name="permissiontype",
+            native_enum=False,
+            create_constraint=True,
+            values_callable=lambda types: [t.value for t in types]
+        ),
         nullable=False
     )
     created_at = Column(
@@ -115,7 +128,23 @@ class DocumentPermission(Base):
         back_populates="document_permissions"
     )
     
-    # Ensure either user_id or role is set
+    # One partial index per kind of grant, each including permission_type,
+    # so both sides of a permission check are answered from a single index
+    # (user_id keeps its own index for ON DELETE CASCADE from users)
     __table_args__ = (
-        {"comment": "Document-level permissions for users or roles"}
+        Index(
+            "ix_document_permissions_document_user_type",
+            "document_id",
+            "user_id",
+            "permission_type",
+            postgresql_where=text("user_id IS NOT NULL")
+        ),
+        Index(
+            "ix_document_permissions_document_role_type",
+            "document_id",
+            "role",
+            "permission_type",
+            postgresql_where=text("role IS NOT NULL")
+        ),
+        {"comment": "Document-level permissions for users or roles"},
     )
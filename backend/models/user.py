@@ -4,11 +4,10 @@ EVIDENT User Model
 This module defines the User model for authentication and authorization.
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-import uuid
 import enum
 
 from backend.core.database import Base
@@ -39,11 +38,14 @@ class User(Base):
     
     __tablename__ = "users"
     
+    # Fetch server-generated id/timestamps via INSERT/UPDATE ... RETURNING
+    # instead of a SELECT when they are next accessed
+    __mapper_args__ = {"eager_defaults": True}
+    
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        index=True
+        server_default=text("uuidv7()")
     )
     username = Column(
         String(50),
@@ -65,8 +67,16 @@ class User(Base):
         String(255),
         nullable=False
     )
+    # Stored as VARCHAR + CHECK of the lowercase values (as created by the
+    # migrations), not as a native PostgreSQL enum type
     role = Column(
-        Enum(UserRole),
+        Enum(
+            UserRole,
+            name="userrole",
+            native_enum=False,
+            create_constraint=True,
+            values_callable=lambda roles: [role.value for role in roles]
+        ),
         nullable=False,
         default=UserRole.VIEWER
     )
@@ -87,6 +97,12 @@ class User(Base):
         nullable=False
     )
     
+    # Case-insensitive uniqueness (also serves register's existence check)
+    __table_args__ = (
+        Index("ux_users_username_lower", func.lower(username), unique=True),
+        Index("ux_users_email_lower", func.lower(email), unique=True),
+    )
+    
     # Relationships
     documents = relationship(
         "Document",
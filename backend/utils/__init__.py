@@ -8,8 +8,14 @@ and response formatting.
 from backend.utils.logger import (
     StructuredLogger,
     setup_logging,
+    log_request,
+    log_response,
+    log_error,
+    log_audit,
     get_request_id,
+    new_request_id,
     set_request_id,
+    reset_request_id,
 )
 from backend.utils.exceptions import (
     EVIDENTException,
@@ -33,8 +39,14 @@ from backend.utils.responses import (
 __all__ = [
     "StructuredLogger",
     "setup_logging",
+    "log_request",
+    "log_response",
+    "log_error",
+    "log_audit",
     "get_request_id",
+    "new_request_id",
     "set_request_id",
+    "reset_request_id",
     "EVIDENTException",
     "AuthenticationError",
     "AuthorizationError",
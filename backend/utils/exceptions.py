@@ -18,6 +18,10 @@ class EVIDENTException(Exception):
         details: Additional error details
     """
     
+    # Slot descriptors for the fields every error carries (BaseException
+    # still provides __dict__, so extra attributes keep working)
+    __slots__ = ("message", "error_code", "details", "_dict_cache")
+    
     def __init__(
         self,
         message: str,
@@ -35,20 +39,26 @@ class EVIDENTException(Exception):
         self.message = message
         self.error_code = error_code
         self.details = details or {}
+        self._dict_cache: Optional[Dict[str, Any]] = None
         super().__init__(self.message)
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert exception to dictionary for JSON response.
         
+        Built on first use and reused, so the same dict is returned on
+        every call; treat it as read-only.
+        
         Returns:
             Dictionary representation of the exception
         """
-        return {
-            "error": self.error_code,
-            "message": self.message,
-            "details": self.details,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "error": self.error_code,
+                "message": self.message,
+                "details": self.details,
+            }
+        return self._dict_cache
 
 
 class AuthenticationError(EVIDENTException):
@@ -56,6 +66,8 @@ class AuthenticationError(EVIDENTException):
     Exception raised when authentication fails.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Authentication failed",
@@ -73,6 +85,8 @@ class AuthorizationError(EVIDENTException):
     Exception raised when authorization fails (user lacks permission).
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Access denied",
@@ -98,6 +112,8 @@ class DocumentNotFoundError(EVIDENTException):
     Exception raised when a document is not found.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         document_id: Optional[str] = None,
@@ -105,7 +121,7 @@ class DocumentNotFoundError(EVIDENTException):
         details: Optional[Dict[str, Any]] = None
     ):
         if message is None:
-            message = f"Document not found"
+            message = "Document not found"
             if document_id:
                 message = f"Document not found: {document_id}"
         
@@ -125,6 +141,8 @@ class LowConfidenceError(EVIDENTException):
     Exception raised when answer confidence is below threshold.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         confidence: float,
@@ -154,6 +172,8 @@ class RefusalError(EVIDENTException):
     Exception raised when the system refuses to answer a query.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         reason: str,
@@ -178,6 +198,8 @@ class ValidationError(EVIDENTException):
     Exception raised when input validation fails.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         field: str,
@@ -202,6 +224,8 @@ class DatabaseError(EVIDENTException):
     Exception raised when database operations fail.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Database operation failed",
@@ -219,6 +243,8 @@ class VectorStoreError(EVIDENTException):
     Exception raised when vector store operations fail.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "Vector store operation failed",
@@ -236,6 +262,8 @@ class LLMError(EVIDENTException):
     Exception raised when LLM operations fail.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str = "LLM operation failed",
@@ -5,41 +5,89 @@ This module provides structured JSON logging for the application,
 including request/response logging, error logging, and audit logging.
 """
 
+import atexit
+import itertools
 import logging
-import json
+import os
+import queue
+import secrets
 import sys
-from datetime import datetime
-from typing import Any, Optional, Dict
+from datetime import datetime, timezone
+from typing import Any, Optional, Dict, Mapping
 from pathlib import Path
-import uuid
-from contextvars import ContextVar
-from logging.handlers import RotatingFileHandler
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+import orjson
 
 from backend.core.config import settings
 
+# Attribute caching an exception's formatted traceback (see JSONFormatter)
+_TRACEBACK_CACHE_ATTR = "_evident_formatted_traceback"
+
+# Request headers never written to logs
+_SENSITIVE_HEADERS = frozenset({"authorization", "cookie", "x-api-key"})
+
+# First characters of those names in either case; other headers skip the
+# lower() + set lookup
+_SENSITIVE_HEADER_INITIALS = frozenset(
+    initial for name in _SENSITIVE_HEADERS for initial in (name[0], name[0].upper())
+)
+
 # Context variable for request correlation ID
 request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
 
+# Attributes every LogRecord has; anything else on a record came from extra=
+_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "taskName"}
+
+# Extra fields rendered as strings (IDs may be UUID objects)
+_STR_FIELDS = frozenset({"user_id", "query_id", "document_id"})
+
+# Extra fields whose (lowercased) name contains any of these are redacted
+_SENSITIVE_FIELD_PARTS = ("token", "password", "secret")
+
+
+def _is_sensitive_field(key: str) -> bool:
+    """Return True if an extra= field name looks like it holds a credential."""
+    lowered = key.lower()
+    return any(part in lowered for part in _SENSITIVE_FIELD_PARTS)
+
 
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
+    
+    Fields passed via extra= are included in the output, except that
+    values of fields named like credentials (token, password, secret) are
+    redacted; values orjson cannot encode natively are rendered with str().
     """
     
+    def __init__(self):
+        """
+        Initialize formatter.
+        
+        Fields that are the same for every record are encoded once and
+        spliced in front of each record's own fields.
+        """
+        super().__init__()
+        self._static_prefix = orjson.dumps({"service": settings.app_name})[:-1] + b","
+    
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
         
         Args:
             record: Log record to format
-            
+        
         Returns:
             JSON string representation of the log record
         """
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # Time the record was created; orjson renders it ("...Z")
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
             "level": record.levelname,
-            "service": settings.app_name,
             "module": record.module,
             "function": record.funcName,
             "message": record.getMessage(),
@@ -52,22 +100,232 @@ class JSONFormatter(logging.Formatter):
         
         # Add exception info if present
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+            log_data["exception"] = self._format_exception(record)
             log_data["exception_type"] = record.exc_info[0].__name__ if record.exc_info[0] else None
         
         # Add extra fields from record
-        if hasattr(record, "user_id"):
-            log_data["user_id"] = str(record.user_id)
-        if hasattr(record, "query_id"):
-            log_data["query_id"] = str(record.query_id)
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
-        if hasattr(record, "document_id"):
-            log_data["document_id"] = str(record.document_id)
-        if hasattr(record, "extra_data"):
-            log_data.update(record.extra_data)
+        for key, value in record.__dict__.items():
+            if key in _RECORD_ATTRS:
+                continue
+            if key == "extra_data":
+                for data_key, data_value in value.items():
+                    log_data[data_key] = (
+                        "***REDACTED***" if _is_sensitive_field(data_key) else data_value
+                    )
+            elif key in _STR_FIELDS:
+                log_data[key] = str(value)
+            elif _is_sensitive_field(key):
+                log_data[key] = "***REDACTED***"
+            else:
+                log_data[key] = value
+        
+        body = orjson.dumps(log_data, default=str, option=orjson.OPT_UTC_Z)
+        return (self._static_prefix + body[1:]).decode()
+    
+    def _format_exception(self, record: logging.LogRecord) -> str:
+        """
+        Format a record's traceback, reusing earlier renderings.
         
-        return json.dumps(log_data, ensure_ascii=False)
+        The text is cached on the record (exc_text, as logging.Formatter
+        does) and on the exception, so logging the same caught exception
+        again does not re-render it. The exception cache is keyed by
+        traceback object, which changes if the exception propagates further.
+        
+        Args:
+            record: Log record with exc_info set
+        
+        Returns:
+            Formatted traceback
+        """
+        if record.exc_text:
+            return record.exc_text
+        
+        _, error, tb = record.exc_info
+        cached = getattr(error, _TRACEBACK_CACHE_ATTR, None)
+        if cached is not None and cached[0] is tb:
+            record.exc_text = cached[1]
+            return record.exc_text
+        
+        record.exc_text = self.formatException(record.exc_info)
+        if error is not None:
+            try:
+                setattr(error, _TRACEBACK_CACHE_ATTR, (tb, record.exc_text))
+            except AttributeError:
+                pass
+        return record.exc_text
+
+
+# Application logger, set by StructuredLogger.setup_logging; the log_*
+# helpers read it directly instead of going through the class
+_LOGGER: Optional[logging.Logger] = None
+
+
+def _get_logger() -> logging.Logger:
+    """Return the application logger, setting up logging on first use."""
+    logger = _LOGGER
+    return logger if logger is not None else StructuredLogger.get_logger()
+
+
+def log_request(
+    method: str,
+    path: str,
+    headers: Optional[Mapping[str, Any]] = None,
+    query_params: Optional[Dict[str, Any]] = None,
+    user_id: Optional[str] = None
+) -> None:
+    """
+    Log HTTP request.
+    
+    Args:
+        method: HTTP method
+        path: Request path
+        headers: Request headers, any mapping (sensitive data will be filtered)
+        query_params: Query parameters
+        user_id: User ID if authenticated
+    """
+    logger = _get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    # Filter sensitive headers (copied once, redacting as we go)
+    safe_headers = {}
+    if headers:
+        safe_headers = {
+            key: "***REDACTED***"
+            if key[:1] in _SENSITIVE_HEADER_INITIALS and key.lower() in _SENSITIVE_HEADERS
+            else value
+            for key, value in headers.items()
+        }
+    
+    extra = {
+        "type": "request",
+        "method": method,
+        "path": path,
+        "headers": safe_headers,
+        "query_params": query_params,
+    }
+    
+    if user_id:
+        extra["user_id"] = user_id
+    
+    logger.info("%s %s", method, path, extra=extra)
+
+
+def log_response(
+    method: str,
+    path: str,
+    status_code: int,
+    duration_ms: int,
+    user_id: Optional[str] = None
+) -> None:
+    """
+    Log HTTP response.
+    
+    Args:
+        method: HTTP method
+        path: Request path
+        status_code: Response status code
+        duration_ms: Response duration in milliseconds
+        user_id: User ID if authenticated
+    """
+    logger = _get_logger()
+    
+    level = logging.INFO
+    if status_code >= 500:
+        level = logging.ERROR
+    elif status_code >= 400:
+        level = logging.WARNING
+    
+    if not logger.isEnabledFor(level):
+        return
+    
+    extra = {
+        "type": "response",
+        "method": method,
+        "path": path,
+        "status_code": status_code,
+        "duration_ms": duration_ms,
+    }
+    
+    if user_id:
+        extra["user_id"] = user_id
+    
+    logger.log(
+        level,
+        "%s %s - %d (%dms)",
+        method,
+        path,
+        status_code,
+        duration_ms,
+        extra=extra
+    )
+
+
+def log_error(
+    error: Exception,
+    context: Optional[Dict[str, Any]] = None,
+    user_id: Optional[str] = None
+) -> None:
+    """
+    Log error with full stack trace.
+    
+    Args:
+        error: Exception to log
+        context: Additional context information
+        user_id: User ID if available
+    """
+    logger = _get_logger()
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    
+    extra = {
+        "type": "error",
+        "error_type": type(error).__name__,
+        "error_message": str(error),
+    }
+    
+    if context:
+        extra.update(context)
+    
+    if user_id:
+        extra["user_id"] = user_id
+    
+    logger.error(
+        "Error: %s - %s",
+        extra["error_type"],
+        extra["error_message"],
+        extra=extra,
+        exc_info=error
+    )
+
+
+def log_audit(
+    action: str,
+    details: Dict[str, Any],
+    user_id: Optional[str] = None
+) -> None:
+    """
+    Log audit event.
+    
+    Args:
+        action: Action being audited
+        details: Additional details about the action
+        user_id: User ID performing the action
+    """
+    logger = _get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    extra = {
+        "type": "audit",
+        "action": action,
+        **details,
+    }
+    
+    if user_id:
+        extra["user_id"] = user_id
+    
+    logger.info("Audit: %s", action, extra=extra)
 
 
 class StructuredLogger:
@@ -77,26 +335,38 @@ class StructuredLogger:
     
     _logger: Optional[logging.Logger] = None
     _file_handler: Optional[RotatingFileHandler] = None
+    _listener: Optional[QueueListener] = None
     
     @classmethod
     def setup_logging(cls, log_file: Optional[Path] = None) -> None:
         """
         Set up structured logging for the application.
         
+        Records are formatted on the calling thread (so the request ID is
+        captured) and handed to a queue; a background listener thread does
+        the console and file writes, keeping I/O off the request path.
+        
         Args:
             log_file: Optional path to log file. If None, logs only to console.
         """
+        global _LOGGER
+        cls.shutdown_logging()
+        
         logger = logging.getLogger(settings.app_name)
         logger.setLevel(logging.DEBUG if settings.debug else logging.INFO)
         
         # Clear existing handlers
         logger.handlers.clear()
         
+        # Records arrive already formatted as JSON by the queue handler
+        passthrough = logging.Formatter("%(message)s")
+        handlers = []
+        
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG if settings.debug else logging.INFO)
-        console_handler.setFormatter(JSONFormatter())
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(passthrough)
+        handlers.append(console_handler)
         
         # File handler (with rotation)
         if log_file:
@@ -108,13 +378,31 @@ class StructuredLogger:
                 encoding='utf-8'
             )
             cls._file_handler.setLevel(logging.INFO)
-            cls._file_handler.setFormatter(JSONFormatter())
-            logger.addHandler(cls._file_handler)
+            cls._file_handler.setFormatter(passthrough)
+            handlers.append(cls._file_handler)
+        
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(JSONFormatter())
+        logger.addHandler(queue_handler)
+        
+        cls._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        cls._listener.start()
         
         # Prevent propagation to root logger
         logger.propagate = False
         
         cls._logger = logger
+        _LOGGER = logger
+    
+    @classmethod
+    def shutdown_logging(cls) -> None:
+        """
+        Stop the background listener, writing out any queued records.
+        """
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
     
     @classmethod
     def get_logger(cls) -> logging.Logger:
@@ -128,155 +416,11 @@ class StructuredLogger:
             cls.setup_logging()
         return cls._logger
     
-    @classmethod
-    def log_request(
-        cls,
-        method: str,
-        path: str,
-        headers: Optional[Dict[str, Any]] = None,
-        query_params: Optional[Dict[str, Any]] = None,
-        user_id: Optional[str] = None
-    ) -> None:
-        """
-        Log HTTP request.
-        
-        Args:
-            method: HTTP method
-            path: Request path
-            headers: Request headers (sensitive data will be filtered)
-            query_params: Query parameters
-            user_id: User ID if authenticated
-        """
-        logger = cls.get_logger()
-        
-        # Filter sensitive headers
-        safe_headers = {}
-        if headers:
-            for key, value in headers.items():
-                if key.lower() in ['authorization', 'cookie', 'x-api-key']:
-                    safe_headers[key] = "***REDACTED***"
-                else:
-                    safe_headers[key] = value
-        
-        extra = {
-            "type": "request",
-            "method": method,
-            "path": path,
-            "headers": safe_headers,
-            "query_params": query_params,
-        }
-        
-        if user_id:
-            extra["user_id"] = user_id
-        
-        logger.info(f"{method} {path}", extra=extra)
-    
-    @classmethod
-    def log_response(
-        cls,
-        method: str,
-        path: str,
-        status_code: int,
-        duration_ms: int,
-        user_id: Optional[str] = None
-    ) -> None:
-        """
-        Log HTTP response.
-        
-        Args:
-            method: HTTP method
-            path: Request path
-            status_code: Response status code
-            duration_ms: Response duration in milliseconds
-            user_id: User ID if authenticated
-        """
-        logger = cls.get_logger()
-        
-        level = logging.INFO
-        if status_code >= 500:
-            level = logging.ERROR
-        elif status_code >= 400:
-            level = logging.WARNING
-        
-        extra = {
-            "type": "response",
-            "method": method,
-            "path": path,
-            "status_code": status_code,
-            "duration_ms": duration_ms,
-        }
-        
-        if user_id:
-            extra["user_id"] = user_id
-        
-        logger.log(
-            level,
-            f"{method} {path} - {status_code} ({duration_ms}ms)",
-            extra=extra
-        )
-    
-    @classmethod
-    def log_error(
-        cls,
-        error: Exception,
-        context: Optional[Dict[str, Any]] = None,
-        user_id: Optional[str] = None
-    ) -> None:
-        """
-        Log error with full stack trace.
-        
-        Args:
-            error: Exception to log
-            context: Additional context information
-            user_id: User ID if available
-        """
-        logger = cls.get_logger()
-        
-        extra = {
-            "type": "error",
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-        }
-        
-        if context:
-            extra.update(context)
-        
-        if user_id:
-            extra["user_id"] = user_id
-        
-        logger.exception(
-            f"Error: {type(error).__name__} - {str(error)}",
-            extra=extra,
-            exc_info=error
-        )
-    
-    @classmethod
-    def log_audit(
-        cls,
-        action: str,
-        details: Dict[str, Any],
-        user_id: Optional[str] = None
-    ) -> None:
-        """
-        Log audit event.
-        
-        Args:
-            action: Action being audited
-            details: Additional details about the action
-            user_id: User ID performing the action
-        """
-        logger = cls.get_logger()
-        
-        extra = {
-            "type": "audit",
-            "action": action,
-            **details,
-        }
-        
-        if user_id:
-            extra["user_id"] = user_id
-        
-        logger.info(f"Audit: {action}", extra=extra)
+    # Request/response/error/audit helpers (the module-level functions above)
+    log_request = staticmethod(log_request)
+    log_response = staticmethod(log_response)
+    log_error = staticmethod(log_error)
+    log_audit = staticmethod(log_audit)
     
     @classmethod
     def debug(cls, message: str, **kwargs) -> None:
@@ -314,6 +458,35 @@ def setup_logging(log_file: Optional[Path] = None) -> None:
     StructuredLogger.setup_logging(log_file)
 
 
+# Flush queued records on interpreter exit
+atexit.register(StructuredLogger.shutdown_logging)
+
+
+def _reset_request_id_sequence() -> None:
+    """Start a new request ID prefix and counter (at import and in forked children)."""
+    global _request_id_prefix, _request_id_counter
+    _request_id_prefix = secrets.token_hex(4)
+    _request_id_counter = itertools.count(1)
+
+
+# Request IDs are a random per-process prefix plus a counter: unique across
+# workers, hosts and restarts without drawing random bytes per request
+_request_id_prefix: str
+_request_id_counter: "itertools.count[int]"
+_reset_request_id_sequence()
+os.register_at_fork(after_in_child=_reset_request_id_sequence)
+
+
+def new_request_id() -> str:
+    """
+    Generate a request correlation ID.
+    
+    Returns:
+        "<process prefix>-<counter>" hex string, e.g. "9f86d081-1a"
+    """
+    return f"{_request_id_prefix}-{next(_request_id_counter):x}"
+
+
 def get_request_id() -> str:
     """
     Get or create request correlation ID.
@@ -323,16 +496,29 @@ def get_request_id() -> str:
     """
     request_id = request_id_var.get()
     if request_id is None:
-        request_id = str(uuid.uuid4())
+        request_id = new_request_id()
         request_id_var.set(request_id)
     return request_id
 
 
-def set_request_id(request_id: str) -> None:
+def set_request_id(request_id: str) -> Token:
     """
     Set request correlation ID.
     
     Args:
         request_id: Request ID to set
+    
+    Returns:
+        Token for reset_request_id
+    """
+    return request_id_var.set(request_id)
+
+
+def reset_request_id(token: Token) -> None:
+    """
+    Restore the request ID that was current before set_request_id.
+    
+    Args:
+        token: Token returned by set_request_id
     """
-    request_id_var.set(request_id)
+    request_id_var.reset(token)
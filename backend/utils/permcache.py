@@ -0,0 +1,73 @@
+"""
+EVIDENT Per-Request Permission Cache
+
+This module holds a dict that lives for one HTTP request, so permission
+and role lookups repeated while handling the request are answered from
+memory. RequestLoggingMiddleware starts a fresh cache for each request
+and drops it when the request ends; no writes to permissions happen
+mid-request, so nothing else needs invalidating.
+Outside a request (scripts, background jobs) there is no cache and
+lookups always run.
+"""
+
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_request_cache: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar(
+    "permission_request_cache", default=None
+)
+
+
+def start_request_cache() -> Token:
+    """
+    Start a fresh cache for the current request.
+    
+    Returns:
+        Token to pass to reset_request_cache when the request ends
+    """
+    return _request_cache.set({})
+
+
+def reset_request_cache(token: Token) -> None:
+    """
+    Discard the current request's cache.
+    
+    Args:
+        token: Token returned by start_request_cache
+    """
+    _request_cache.reset(token)
+
+
+def get_request_cache() -> Optional[Dict[Hashable, Any]]:
+    """
+    Get the current request's cache.
+    
+    Returns:
+        Cache dict, or None outside a request
+    """
+    return _request_cache.get()
+
+
+def cached(key: Hashable, load: Callable[[], Any]) -> Any:
+    """
+    Return the cached value for key, calling load() on a miss.
+    
+    Keys should start with a name for the kind of lookup, e.g.
+    ("role", role_name), so different lookups never collide.
+    
+    Args:
+        key: Cache key
+        load: Function computing the value
+    
+    Returns:
+        Cached or freshly loaded value
+    """
+    cache = _request_cache.get()
+    if cache is None:
+        return load()
+    
+    try:
+        return cache[key]
+    except KeyError:
+        value = cache[key] = load()
+        return value
@@ -5,9 +5,64 @@ This module defines Pydantic models for API responses,
 ensuring consistent response formatting across the application.
 """
 
-from pydantic import BaseModel, Field
-from typing import Any, Optional, List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, List, Sequence, Union
 from datetime import datetime
+from itertools import islice
+import time
+
+import orjson
+
+# Factories build models with model_construct(): their inputs come from
+# server code, so field validation is skipped.
+# The *_json factories below build the JSON body as a plain dict and return
+# an ORJSONResponse directly, skipping model validation and FastAPI's
+# jsonable_encoder pass. Bodies match the corresponding model's fields.
+
+
+# (second, datetime) of the last response timestamp; replaced as one tuple
+_timestamp_cache: tuple = (0, datetime.utcfromtimestamp(0))
+
+
+def _response_timestamp() -> datetime:
+    """
+    Current UTC time truncated to the second, shared by responses built
+    within the same second.
+    
+    Returns:
+        Naive UTC datetime (as datetime.utcnow() returns)
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, timestamp = _timestamp_cache
+    if cached_second != second:
+        timestamp = datetime.utcfromtimestamp(second)
+        _timestamp_cache = (second, timestamp)
+    return timestamp
+
+
+async def _stream_paginated_body(
+    items: AsyncIterable[Any],
+    meta: dict
+) -> AsyncIterator[bytes]:
+    """
+    Yield a PaginatedResponse JSON body one item at a time.
+    
+    Args:
+        items: Page items (each must be orjson-serializable)
+        meta: Remaining PaginatedResponse fields (total, page, ...)
+    
+    Yields:
+        Chunks of the JSON body
+    """
+    yield b'{"items":['
+    separator = b""
+    async for item in items:
+        yield separator + orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS)
+        separator = b","
+    # meta is serialized as an object; drop its "{" to continue this one
+    yield b"]," + orjson.dumps(meta)[1:]
 
 
 class APIResponse(BaseModel):
@@ -29,19 +84,18 @@ class APIResponse(BaseModel):
     error: Optional[str] = Field(default=None, description="Error code if failed")
     details: Optional[dict] = Field(default=None, description="Additional error details")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Response timestamp"
+        default_factory=_response_timestamp,
+        description="Response timestamp (UTC, second precision)"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "success": True,
-                "message": "Operation completed successfully",
-                "data": {},
-                "timestamp": "2024-01-01T12:00:00Z"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "success": True,
+            "message": "Operation completed successfully",
+            "data": {},
+            "timestamp": "2024-01-01T12:00:00Z"
         }
+    })
     
     @classmethod
     def success_response(
@@ -59,7 +113,7 @@ class APIResponse(BaseModel):
         Returns:
             APIResponse instance
         """
-        return cls(
+        return cls.model_construct(
             success=True,
             message=message,
             data=data
@@ -83,12 +137,77 @@ class APIResponse(BaseModel):
         Returns:
             APIResponse instance
         """
-        return cls(
+        return cls.model_construct(
             success=False,
             message=message,
             error=error,
             details=details
         )
+    
+    @staticmethod
+    def success_json(
+        message: str = "Operation completed successfully",
+        data: Any = None,
+        status_code: int = 200
+    ) -> ORJSONResponse:
+        """
+        Create a success response, serialized without building the model.
+        
+        Args:
+            message: Success message
+            data: Response data (must be orjson-serializable)
+            status_code: HTTP status code
+            
+        Returns:
+            ORJSONResponse with the APIResponse body
+        """
+        return ORJSONResponse(
+            {
+                "success": True,
+                "message": message,
+                "data": data,
+                "error": None,
+                "details": None,
+                "timestamp": _response_timestamp(),
+            },
+            status_code=status_code
+        )
+    
+    @staticmethod
+    def error_json(
+        message: str,
+        error: str,
+        details: Optional[Union[dict, bytes]] = None,
+        status_code: int = 400
+    ) -> ORJSONResponse:
+        """
+        Create an error response, serialized without building the model.
+        
+        Args:
+            message: Error message
+            error: Error code
+            details: Additional error details, or an already JSON-encoded
+                object (e.g. a downstream service's error body), which is
+                embedded as-is instead of being parsed and re-encoded
+            status_code: HTTP status code
+            
+        Returns:
+            ORJSONResponse with the APIResponse body
+        """
+        if isinstance(details, bytes):
+            details = orjson.Fragment(details)
+        
+        return ORJSONResponse(
+            {
+                "success": False,
+                "message": message,
+                "data": None,
+                "error": error,
+                "details": details,
+                "timestamp": _response_timestamp(),
+            },
+            status_code=status_code
+        )
 
 
 class Source(BaseModel):
@@ -118,17 +237,84 @@ class Source(BaseModel):
         description="Excerpt from the source text"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "document_id": "123e4567-e89b-12d3-a456-426614174000",
-                "document_title": "Mission Specification Document",
-                "chunk_index": 5,
-                "page": 12,
-                "similarity_score": 0.85,
-                "text_snippet": "The mission objectives include..."
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "document_id": "123e4567-e89b-12d3-a456-426614174000",
+            "document_title": "Mission Specification Document",
+            "chunk_index": 5,
+            "page": 12,
+            "similarity_score": 0.85,
+            "text_snippet": "The mission objectives include..."
         }
+    })
+
+
+# Shared (immutable) value for responses without sources; orjson encodes
+# a tuple as a JSON array, so the body is unchanged
+_EMPTY_SOURCES: tuple = ()
+
+
+# Most sources returned per query response
+MAX_SOURCES = 20
+
+
+def _top_sources(
+    sources: Optional[Iterable[Union[Source, dict]]],
+    max_sources: int
+) -> Sequence[Source]:
+    """
+    Take the first max_sources sources as Source models.
+    
+    Dicts are built with model_construct(), and only for the sources kept,
+    so callers can pass a lazy iterator of ranked candidates.
+    """
+    if not sources:
+        return _EMPTY_SOURCES
+    return [
+        s if isinstance(s, Source) else Source.model_construct(**s)
+        for s in islice(sources, max_sources)
+    ]
+
+
+def _source_dicts(
+    sources: Optional[Iterable[Union[Source, dict]]],
+    max_sources: int
+) -> Sequence[dict]:
+    """
+    Take the first max_sources sources as plain dicts for orjson.
+    
+    A Source's __dict__ already holds exactly its field values, so this
+    skips model_dump().
+    """
+    if not sources:
+        return _EMPTY_SOURCES
+    return [
+        s.__dict__ if isinstance(s, Source) else s
+        for s in islice(sources, max_sources)
+    ]
+
+
+class _QueryTimer:
+    """
+    Measures a query's response time with the monotonic clock.
+    
+    Use via QueryResponse.timed() and pass elapsed_ms as the factories'
+    response_time_ms.
+    """
+    
+    __slots__ = ("_start",)
+    
+    def __enter__(self) -> "_QueryTimer":
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        return None
+    
+    @property
+    def elapsed_ms(self) -> int:
+        """Whole milliseconds since the timer was entered."""
+        return (time.perf_counter_ns() - self._start) // 1_000_000
 
 
 class QueryResponse(BaseModel):
@@ -154,8 +340,8 @@ class QueryResponse(BaseModel):
         le=1.0,
         description="Confidence score between 0 and 1"
     )
-    sources: List[Source] = Field(
-        default_factory=list,
+    sources: Sequence[Source] = Field(
+        default=_EMPTY_SOURCES,
         description="List of source citations"
     )
     refusal_reason: Optional[str] = Field(
@@ -171,51 +357,70 @@ class QueryResponse(BaseModel):
         description="Response time in milliseconds"
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "answer": "Based on the mission specification document...",
-                "confidence": 0.87,
-                "sources": [
-                    {
-                        "document_id": "123e4567-e89b-12d3-a456-426614174000",
-                        "document_title": "Mission Specification Document",
-                        "chunk_index": 5,
-                        "page": 12,
-                        "similarity_score": 0.85,
-                        "text_snippet": "The mission objectives include..."
-                    }
-                ],
-                "refusal_reason": None,
-                "query_id": "123e4567-e89b-12d3-a456-426614174001",
-                "response_time_ms": 150
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "answer": "Based on the mission specification document...",
+            "confidence": 0.87,
+            "sources": [
+                {
+                    "document_id": "123e4567-e89b-12d3-a456-426614174000",
+                    "document_title": "Mission Specification Document",
+                    "chunk_index": 5,
+                    "page": 12,
+                    "similarity_score": 0.85,
+                    "text_snippet": "The mission objectives include..."
+                }
+            ],
+            "refusal_reason": None,
+            "query_id": "123e4567-e89b-12d3-a456-426614174001",
+            "response_time_ms": 150
         }
+    })
+    
+    @staticmethod
+    def timed() -> _QueryTimer:
+        """
+        Time a query for its response_time_ms.
+        
+        Usage:
+            with QueryResponse.timed() as timer:
+                ...
+                return QueryResponse.success_json(
+                    answer, confidence, sources,
+                    response_time_ms=timer.elapsed_ms
+                )
+        
+        Returns:
+            Timer context manager
+        """
+        return _QueryTimer()
     
     @classmethod
     def refused_response(
         cls,
         refusal_reason: str,
-        sources: Optional[List[Source]] = None,
+        sources: Optional[Iterable[Union[Source, dict]]] = None,
         query_id: Optional[str] = None,
-        response_time_ms: int = 0
+        response_time_ms: int = 0,
+        max_sources: int = MAX_SOURCES
     ) -> "QueryResponse":
         """
         Create a refused response.
         
         Args:
             refusal_reason: Reason for refusal
-            sources: Retrieved sources (optional)
+            sources: Retrieved sources, best first (optional)
             query_id: Query ID (optional)
             response_time_ms: Response time in milliseconds
+            max_sources: Most sources to include
             
         Returns:
             QueryResponse instance with answer=None
         """
-        return cls(
+        return cls.model_construct(
             answer=None,
             confidence=None,
-            sources=sources or [],
+            sources=_top_sources(sources, max_sources),
             refusal_reason=refusal_reason,
             query_id=query_id,
             response_time_ms=response_time_ms
@@ -226,9 +431,10 @@ class QueryResponse(BaseModel):
         cls,
         answer: str,
         confidence: float,
-        sources: List[Source],
+        sources: Iterable[Union[Source, dict]],
         query_id: Optional[str] = None,
-        response_time_ms: int = 0
+        response_time_ms: int = 0,
+        max_sources: int = MAX_SOURCES
     ) -> "QueryResponse":
         """
         Create a successful response with answer.
@@ -236,21 +442,89 @@ class QueryResponse(BaseModel):
         Args:
             answer: Generated answer
             confidence: Confidence score
-            sources: List of source citations
+            sources: Source citations, best first (Source models or equivalent dicts)
             query_id: Query ID (optional)
             response_time_ms: Response time in milliseconds
+            max_sources: Most sources to include
             
         Returns:
             QueryResponse instance with answer
         """
-        return cls(
+        return cls.model_construct(
             answer=answer,
             confidence=confidence,
-            sources=sources,
+            sources=_top_sources(sources, max_sources),
             refusal_reason=None,
             query_id=query_id,
             response_time_ms=response_time_ms
         )
+    
+    @staticmethod
+    def refused_json(
+        refusal_reason: str,
+        sources: Optional[Iterable[Union[Source, dict]]] = None,
+        query_id: Optional[str] = None,
+        response_time_ms: int = 0,
+        max_sources: int = MAX_SOURCES
+    ) -> ORJSONResponse:
+        """
+        Create a refused response, serialized without building the model.
+        
+        Args:
+            refusal_reason: Reason for refusal
+            sources: Retrieved sources, best first (optional)
+            query_id: Query ID (optional)
+            response_time_ms: Response time in milliseconds
+            max_sources: Most sources to include
+            
+        Returns:
+            ORJSONResponse with the QueryResponse body (answer=None)
+        """
+        return ORJSONResponse({
+            "answer": None,
+            "confidence": None,
+            "sources": _source_dicts(sources, max_sources),
+            "refusal_reason": refusal_reason,
+            "query_id": query_id,
+            "response_time_ms": response_time_ms,
+        })
+    
+    @staticmethod
+    def success_json(
+        answer: str,
+        confidence: float,
+        sources: Iterable[Union[Source, dict]],
+        query_id: Optional[str] = None,
+        response_time_ms: int = 0,
+        max_sources: int = MAX_SOURCES
+    ) -> ORJSONResponse:
+        """
+        Create a successful response, serialized without building the model.
+        
+        Args:
+            answer: Generated answer
+            confidence: Confidence score
+            sources: Source citations, best first (Source models or equivalent dicts)
+            query_id: Query ID (optional)
+            response_time_ms: Response time in milliseconds
+            max_sources: Most sources to include
+            
+        Returns:
+            ORJSONResponse with the QueryResponse body
+        """
+        return ORJSONResponse({
+            "answer": answer,
+            "confidence": confidence,
+            "sources": _source_dicts(sources, max_sources),
+            "refusal_reason": None,
+            "query_id": query_id,
+            "response_time_ms": response_time_ms,
+        })
+
+
+def _total_pages(total: int, page_size: int) -> int:
+    """Number of pages needed for total items (0 when there are none)."""
+    return -(-total // page_size)
 
 
 class PaginatedResponse(BaseModel):
@@ -271,16 +545,15 @@ class PaginatedResponse(BaseModel):
     page_size: int = Field(ge=1, description="Number of items per page")
     total_pages: int = Field(ge=0, description="Total number of pages")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "items": [],
-                "total": 100,
-                "page": 1,
-                "page_size": 20,
-                "total_pages": 5
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "items": [],
+            "total": 100,
+            "page": 1,
+            "page_size": 20,
+            "total_pages": 5
         }
+    })
     
     @classmethod
     def create(
@@ -302,12 +575,44 @@ class PaginatedResponse(BaseModel):
         Returns:
             PaginatedResponse instance
         """
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        
-        return cls(
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=_total_pages(total, page_size)
+        )
+    
+    @classmethod
+    def stream(
+        cls,
+        items: AsyncIterable[Any],
+        total: int,
+        page: int,
+        page_size: int
+    ) -> StreamingResponse:
+        """
+        Create a paginated response that serializes items as they arrive.
+        
+        Unlike create(), the page is never held in memory: each item is
+        encoded and written to the client as the iterator yields it (e.g.
+        from AsyncSession.stream_scalars()). The body matches create().
+        
+        Args:
+            items: Async iterable of page items (must be orjson-serializable)
+            total: Total number of items
+            page: Current page number (1-indexed)
+            page_size: Number of items per page
+            
+        Returns:
+            StreamingResponse with the PaginatedResponse body
+        """
+        return StreamingResponse(
+            _stream_paginated_body(items, {
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": _total_pages(total, page_size)
+            }),
+            media_type="application/json"
         )